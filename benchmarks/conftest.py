@@ -0,0 +1,57 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+import json
+
+import pytest
+
+from sc_client import client, session
+from sc_client.constants import common, sc_type
+from sc_client.models import Response, ScAddr, ScConstruction, ScLinkContent, ScLinkContentType, ScTemplate
+from sc_client.testing import ScServerEmulator
+
+# pylint: disable=W0212
+
+CONSTRUCTION_SIZE = 10_000
+TEMPLATE_SIZE = 1_000
+TEMPLATE_RESULT_ROWS = 100_000
+
+
+@pytest.fixture(scope="session")
+def large_construction() -> ScConstruction:
+    const = ScConstruction()
+    for i in range(CONSTRUCTION_SIZE // 3):
+        const.generate_node(sc_type.CONST_NODE, f"node_{i}")
+        const.generate_link(sc_type.CONST_NODE_LINK, ScLinkContent(f"content {i}", ScLinkContentType.STRING))
+        const.generate_connector(sc_type.CONST_PERM_POS_ARC, f"node_{i}", ScAddr(i + 1))
+    return const
+
+
+@pytest.fixture(scope="session")
+def large_template() -> ScTemplate:
+    templ = ScTemplate()
+    for i in range(TEMPLATE_SIZE):
+        templ.triple(ScAddr(i + 1), sc_type.VAR_PERM_POS_ARC >> f"_arc_{i}", sc_type.VAR_NODE >> f"_node_{i}")
+    return templ
+
+
+@pytest.fixture(scope="session")
+def large_search_response() -> Response:
+    payload = {
+        common.ALIASES: {"_node": 0, "_arc": 1, "_link": 2},
+        common.ADDRS: [[i, i + 1, i + 2] for i in range(1, 3 * TEMPLATE_RESULT_ROWS, 3)],
+    }
+    message = {common.ID: 1, common.EVENT: False, common.STATUS: True, common.PAYLOAD: payload}
+    return json.loads(json.dumps(message))
+
+
+@pytest.fixture(scope="module")
+def emulator():
+    with ScServerEmulator() as server:
+        client.connect(server.url)
+        yield server
+        client.disconnect()
+    session._ScClientSession.clear()
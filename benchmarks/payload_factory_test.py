@@ -0,0 +1,57 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+import json
+
+import pytest
+
+from sc_client._internal_utils import EncodedJson
+from sc_client.client._payload_factory import PayloadFactory
+from sc_client.constants import sc_type
+from sc_client.constants.common import TEMPLATE, ClientCommand
+from sc_client.models import ScAddr, ScTemplate
+
+# pylint: disable=W0212
+
+
+def test_generate_elements_payload(benchmark, large_construction):
+    payload = benchmark(PayloadFactory().run, ClientCommand.GENERATE_ELEMENTS, large_construction)
+    assert len(payload) == len(large_construction)
+
+
+def test_search_by_template_payload(benchmark, large_template):
+    payload = benchmark(PayloadFactory().run, ClientCommand.SEARCH_BY_TEMPLATE, large_template, None)
+    assert len(payload[TEMPLATE]) == len(large_template.triple_list)
+
+
+@pytest.mark.parametrize("prepared", [False, True], ids=["not_prepared", "prepared"])
+def test_search_by_template_encoding(benchmark, prepared):
+    templ = ScTemplate()
+    templ.triple(ScAddr(1), sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE >> "_action")
+    templ.triple(ScAddr(2), sc_type.VAR_PERM_POS_ARC, "_action")
+    templ.quintuple(
+        "_action", sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE >> "_arg", sc_type.VAR_PERM_POS_ARC, ScAddr(3)
+    )
+    templ.triple("_arg", sc_type.VAR_COMMON_ARC, sc_type.VAR_NODE_LINK >> "_link")
+    if prepared:
+        templ.prepare()
+    factory = PayloadFactory()
+    params = [{"_action": ScAddr(i)} for i in range(1, 1001)]
+
+    def encode():
+        for action_params in params:
+            payload = factory.run(ClientCommand.SEARCH_BY_TEMPLATE, templ, action_params)
+            if not isinstance(payload, EncodedJson):
+                payload = json.dumps(payload)
+        return payload
+
+    assert json.loads(benchmark(encode))[TEMPLATE][0][0]["value"] == 1
+
+
+def test_get_elements_types_payload(benchmark):
+    addrs = [ScAddr(i) for i in range(1, 100_001)]
+    payload = benchmark(PayloadFactory().run, ClientCommand.GET_ELEMENTS_TYPES, *addrs)
+    assert len(payload) == len(addrs)
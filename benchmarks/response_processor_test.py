@@ -0,0 +1,88 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+import json
+
+import pytest
+from conftest import TEMPLATE_RESULT_ROWS
+
+from sc_client import session
+from sc_client.client._response_processor import ResponseProcessor
+from sc_client.constants import common
+from sc_client.constants.common import ClientCommand
+from sc_client.models import Response
+
+
+def test_search_by_template_response(benchmark, large_search_response):
+    results = benchmark(ResponseProcessor().run, ClientCommand.SEARCH_BY_TEMPLATE, large_search_response)
+    assert len(results) == TEMPLATE_RESULT_ROWS
+
+
+def test_search_by_template_response_as_columns(benchmark, large_search_response):
+    def pivot():
+        results = ResponseProcessor().run(ClientCommand.SEARCH_BY_TEMPLATE, large_search_response, as_columns=True)
+        return results.unique(0)
+
+    assert len(benchmark(pivot)) > 0
+
+
+def test_search_by_template_response_pivot(benchmark, large_search_response):
+    def pivot():
+        results = ResponseProcessor().run(ClientCommand.SEARCH_BY_TEMPLATE, large_search_response)
+        return list(dict.fromkeys(result.get(0) for result in results))
+
+    assert len(benchmark(pivot)) > 0
+
+
+@pytest.fixture(scope="module")
+def wide_search_response() -> Response:
+    payload = {
+        common.ALIASES: {"_first": 0, "_last": 14},
+        common.ADDRS: [[i % 1000 + j for j in range(15)] for i in range(TEMPLATE_RESULT_ROWS)],
+    }
+    return Response(id=1, status=True, event=False, payload=payload)
+
+
+@pytest.mark.parametrize("project", [None, ["_first", "_last"]], ids=["all", "projected"])
+def test_search_by_template_response_distinct(benchmark, wide_search_response, project):
+    def distinct():
+        if project is not None:
+            return ResponseProcessor().run(
+                ClientCommand.SEARCH_BY_TEMPLATE, wide_search_response, project=project, distinct=True
+            )
+        results = ResponseProcessor().run(ClientCommand.SEARCH_BY_TEMPLATE, wide_search_response)
+        return list(dict.fromkeys((result.get("_first"), result.get("_last")) for result in results))
+
+    assert len(benchmark(distinct)) == 1000
+
+
+def test_search_by_template_response_decoding(benchmark, large_search_response):
+    message = json.dumps(large_search_response)
+    response = benchmark(session.decode_response, message)
+    assert len(list(response["payload"]["addrs"])) == TEMPLATE_RESULT_ROWS
+
+
+def test_search_by_template_response_decoding_as_columns(benchmark, large_search_response):
+    message = json.dumps(large_search_response)
+
+    def decode():
+        response = session.decode_response(message)
+        return ResponseProcessor().run(ClientCommand.SEARCH_BY_TEMPLATE, response, as_columns=True)
+
+    assert len(benchmark(decode)) == TEMPLATE_RESULT_ROWS
+
+
+def test_get_link_content_response_decoding(benchmark):
+    payload = [{common.VALUE: f"content {i}", common.TYPE: "string"} for i in range(100_000)]
+    message = json.dumps({common.ID: 1, common.EVENT: False, common.STATUS: True, common.PAYLOAD: payload})
+    response = benchmark(session.decode_response, message)
+    assert len(response["payload"]) == 100_000
+
+
+def test_get_elements_types_response(benchmark):
+    response = Response(id=1, status=True, event=False, payload=[33] * 100_000)
+    types = benchmark(ResponseProcessor().run, ClientCommand.GET_ELEMENTS_TYPES, response)
+    assert len(types) == 100_000
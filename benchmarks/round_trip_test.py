@@ -0,0 +1,56 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+import pytest
+
+from sc_client import client
+from sc_client.constants import sc_type
+from sc_client.models import ScConstruction, ScLinkContent, ScLinkContentType, ScTemplate
+
+# pylint: disable=W0621,W0613
+
+
+@pytest.fixture(scope="module")
+def node_with_links(emulator):
+    const = ScConstruction()
+    const.generate_node(sc_type.CONST_NODE, "node")
+    for i in range(100):
+        const.generate_link(sc_type.CONST_NODE_LINK, ScLinkContent(f"content {i}", ScLinkContentType.STRING), f"l{i}")
+        const.generate_connector(sc_type.CONST_PERM_POS_ARC, "node", f"l{i}")
+    addrs = client.generate_elements(const)
+    return addrs[0], addrs[1::2]
+
+
+def test_generate_elements_round_trip(benchmark, emulator):
+    const = ScConstruction()
+    for _ in range(100):
+        const.generate_node(sc_type.CONST_NODE)
+    assert len(benchmark(client.generate_elements, const)) == 100
+
+
+def test_search_by_template_round_trip(benchmark, node_with_links):
+    node, links = node_with_links
+    templ = ScTemplate()
+    templ.triple(node, sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE_LINK >> "_link")
+    assert len(benchmark(client.search_by_template, templ)) == len(links)
+
+
+def test_get_link_content_round_trip(benchmark, node_with_links):
+    _, links = node_with_links
+    assert len(benchmark(client.get_link_content, *links)) == len(links)
+
+
+@pytest.mark.parametrize("window", [1, 64])
+def test_search_by_template_batch_round_trip(benchmark, node_with_links, window):
+    _, links = node_with_links
+    templ = ScTemplate()
+    templ.triple(sc_type.VAR_NODE >> "_node", sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE_LINK >> "_link")
+    params_list = [{"_link": link} for link in links]
+
+    def search():
+        return list(client.search_by_template_batch(templ, params_list, window))
+
+    assert len(benchmark(search)) == len(links)
@@ -0,0 +1,45 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+from sc_client.constants import ScType, sc_type
+from sc_client.constants.sc_type import batch
+
+# pylint: disable=W0212
+
+TYPES = [value for value in vars(sc_type).values() if isinstance(value, ScType)] * 100
+
+
+def test_type_predicates(benchmark):
+    def classify():
+        return [(t.is_node(), t.is_connector(), t.is_link(), t.is_const(), t.is_var()) for t in TYPES]
+
+    assert len(benchmark(classify)) == len(TYPES)
+
+
+def test_type_merge(benchmark):
+    def merge():
+        return [t._is_extendable_to(sc_type.CONST_NODE_STRUCTURE) for t in TYPES]
+
+    assert len(benchmark(merge)) == len(TYPES)
+
+
+def test_type_merge_extendable(benchmark):
+    extendable = [t for t in TYPES if t._is_extendable_to(sc_type.CONST_NODE_STRUCTURE)]
+
+    def merge():
+        return [t.merge(sc_type.CONST_NODE_STRUCTURE) for t in extendable]
+
+    assert len(benchmark(merge)) == len(extendable)
+
+
+def test_type_construction(benchmark):
+    values = [t.value for t in TYPES]
+    assert len(benchmark(lambda: [ScType(value) for value in values])) == len(values)
+
+
+def test_batch_classification(benchmark):
+    masks = benchmark(batch.classify, TYPES)
+    assert len(masks["node"]) == len(TYPES)
@@ -13,18 +13,14 @@ REQUIRED_PYTHON = (3, 8)
 
 
 if CURRENT_PYTHON < REQUIRED_PYTHON:
-    sys.stderr.write(
-        """
+    sys.stderr.write("""
             ==========================
             Unsupported Python version
             ==========================
             This version of py-sc-client requires at least Python {}.{}, but
             you're trying to install it on Python {}.{}. To resolve this,
             consider upgrading to a supported Python version.
-            """.format(
-            *REQUIRED_PYTHON, *CURRENT_PYTHON
-        )
-    )
+            """.format(*REQUIRED_PYTHON, *CURRENT_PYTHON))
     sys.exit(1)
 
 
@@ -53,6 +49,12 @@ setup(
     package_dir={"": "src"},
     python_requires=">=3.8, <4",
     install_requires=INSTALL_REQUIRES,
+    entry_points={
+        "console_scripts": [
+            "sc-client-load = sc_client.testing.load:main",
+            "sc-client-replay = sc_client.recording:main",
+        ]
+    },
     project_urls={
         "Bug Reports": "https://github.com/ostis-ai/py-sc-client/issues",
         "Source": "https://github.com/ostis-ai/py-sc-client",
@@ -4,21 +4,137 @@ Distributed under the MIT License
 (See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
 """
 
+from __future__ import annotations
+
+import json
+import re
+from itertools import chain
+from json.decoder import JSONDecodeError, scanstring
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
 from sc_client.constants import common
-from sc_client.constants.sc_types import ScType
-from sc_client.models import ScAddr, ScTemplateValue
-
-
-def process_triple_item(item: ScTemplateValue) -> dict:
-    item_value = item.value
-    item_alias = item.alias
-    if isinstance(item_value, ScAddr):
-        result = {common.TYPE: common.Types.ADDR, common.VALUE: item_value.value}
-    elif isinstance(item_value, ScType):
-        result = {common.TYPE: common.Types.TYPE, common.VALUE: item_value.value}
-    else:
-        result = {common.TYPE: common.Types.ALIAS, common.VALUE: item_value}
-
-    if item_alias:
-        result[common.ALIAS] = item_alias
+from sc_client.constants.numeric import ADDRS_ROWS_CHUNK_SIZE
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_ROWS_END = re.compile(r"\][ \t\n\r]*\]")
+_NUMBERS = re.compile(r"[0-9eE.+\- \t\n\r,]*")
+_decoder = json.JSONDecoder()
+
+
+class EncodedJson(str):
+    """Json text sent as a part of a request without encoding it again"""
+
+
+class AddrsRows:
+    """
+    Rows of address values in a message of the sc-server, decoded by chunks on iteration.
+
+    The message is kept until the rows are released, so a full list of rows is never built.
+    """
+
+    __slots__ = ("_message", "_start", "_end")
+
+    def __init__(self, message: str, start: int, end: int) -> None:
+        self._message = message
+        self._start = start
+        self._end = end
+
+    def chunks(self, chunk_size: int = ADDRS_ROWS_CHUNK_SIZE) -> Iterator[List[List[int]]]:
+        message, start, end = self._message, self._start, self._end
+        while 0 <= start < end:
+            # rows contain ints only, so the first bracket after the chunk size closes a row
+            chunk_end = message.find("]", min(start + chunk_size, end - 1)) + 1
+            yield json.loads(f"[{message[start:chunk_end]}]")
+            start = message.find("[", chunk_end, end)
+
+    def __iter__(self) -> Iterator[List[int]]:
+        return chain.from_iterable(self.chunks())
+
+
+def _skip_whitespace(message: str, index: int) -> int:
+    return _WHITESPACE.match(message, index).end()
+
+
+def _decode_object(
+    message: str, index: int, decode_value: Callable[[str, str, int], Tuple[Any, int]]
+) -> Tuple[Dict[str, Any], int]:
+    result = {}
+    index = _skip_whitespace(message, index + 1)
+    if message[index] == "}":
+        return result, index + 1
+    while True:
+        if message[index] != '"':
+            raise JSONDecodeError("Expecting property name enclosed in double quotes", message, index)
+        key, index = scanstring(message, index + 1)
+        index = _skip_whitespace(message, index)
+        if message[index] != ":":
+            raise JSONDecodeError("Expecting ':' delimiter", message, index)
+        result[key], index = decode_value(key, message, _skip_whitespace(message, index + 1))
+        index = _skip_whitespace(message, index)
+        if message[index] == "}":
+            return result, index + 1
+        if message[index] != ",":
+            raise JSONDecodeError("Expecting ',' delimiter", message, index)
+        index = _skip_whitespace(message, index + 1)
+
+
+def _decode_array(message: str, index: int) -> Tuple[List[Any], int]:
+    # items are decoded one by one or by chunks of numbers, so other threads run between them
+    result = []
+    start = _skip_whitespace(message, index + 1)
+    numbers_end = _NUMBERS.match(message, start).end()
+    if message[numbers_end] == "]":
+        while start < numbers_end:
+            chunk_end = message.find(",", start + ADDRS_ROWS_CHUNK_SIZE, numbers_end)
+            chunk_end = numbers_end if chunk_end == -1 else chunk_end
+            result.extend(json.loads(f"[{message[start:chunk_end]}]"))
+            start = chunk_end + 1
+        return result, numbers_end + 1
+    index = start
+    while True:
+        item, index = _decoder.raw_decode(message, index)
+        result.append(item)
+        index = _skip_whitespace(message, index)
+        if message[index] == "]":
+            return result, index + 1
+        if message[index] != ",":
+            raise JSONDecodeError("Expecting ',' delimiter", message, index)
+        index = _skip_whitespace(message, index + 1)
+
+
+def _decode_payload_value(key: str, message: str, index: int) -> Tuple[Any, int]:
+    if key == common.ADDRS and message[index] == "[":
+        start = _skip_whitespace(message, index + 1)
+        if message[start] == "[":
+            rows_end = _ROWS_END.search(message, start)
+            if rows_end is None:
+                raise JSONDecodeError("Unterminated rows of addresses", message, start)
+            return AddrsRows(message, start, rows_end.start() + 1), rows_end.end()
+    return _decoder.raw_decode(message, index)
+
+
+def _decode_envelope_value(key: str, message: str, index: int) -> Tuple[Any, int]:
+    if key == common.PAYLOAD and message[index] == "{":
+        return _decode_object(message, index, _decode_payload_value)
+    if key == common.PAYLOAD and message[index] == "[":
+        return _decode_array(message, index)
+    return _decoder.raw_decode(message, index)
+
+
+def decode_incrementally(message: str) -> Dict[str, Any]:
+    """
+    Decode a message of the sc-server like `json.loads`, but with rows of addresses of the payload left undecoded.
+
+    Nested lists in `payload.addrs` become AddrsRows. Items of a list payload are decoded one by one,
+    so a large message doesn't hold the GIL for the whole decoding.
+    """
+    index = _skip_whitespace(message, 0)
+    try:
+        if message[index] != "{":
+            return json.loads(message)
+        result, index = _decode_object(message, index, _decode_envelope_value)
+    except IndexError as error:
+        raise JSONDecodeError("Unterminated object", message, len(message)) from error
+    if _skip_whitespace(message, index) != len(message):
+        raise JSONDecodeError("Extra data", message, index)
     return result
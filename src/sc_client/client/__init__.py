@@ -17,10 +17,12 @@ from sc_client.client._api import (
     events_create,
     events_destroy,
     generate_by_template,
+    generate_by_template_batch,
     generate_elements,
     generate_elements_by_scs,
     get_elements_types,
     get_link_content,
+    get_link_contents_stream,
     get_links_by_content,
     get_links_by_content_substring,
     get_links_contents_by_content_substring,
@@ -29,12 +31,17 @@ from sc_client.client._api import (
     is_event_valid,
     resolve_keynodes,
     search_by_template,
+    search_by_template_batch,
     search_link_contents_by_content_substrings,
     search_links_by_contents,
     search_links_by_contents_substrings,
+    set_coalescing,
     set_error_handler,
     set_link_contents,
+    set_link_contents_stream,
     set_reconnect_handler,
+    set_recorder,
+    set_tracer,
     template_generate,
     template_search,
 )
@@ -6,14 +6,22 @@ Distributed under the MIT License
 
 from __future__ import annotations
 
+import copy
 import warnings
+from typing import Iterable, Iterator, Sequence, Tuple
 
-from sc_client import session
+from sc_client import recording, session, tracing
 from sc_client.constants import common, exceptions
-from sc_client.constants.numeric import SERVER_RECONNECT_RETRIES, SERVER_RECONNECT_RETRY_DELAY
+from sc_client.constants.numeric import (
+    CONTENT_PIPELINE_WINDOW,
+    PIPELINE_WINDOW,
+    SERVER_RECONNECT_RETRIES,
+    SERVER_RECONNECT_RETRY_DELAY,
+)
 from sc_client.constants.sc_types import ScType
 from sc_client.models import (
     ScAddr,
+    ScAddrArray,
     ScConstruction,
     ScEventSubscription,
     ScEventSubscriptionParams,
@@ -24,6 +32,7 @@ from sc_client.models import (
     ScTemplateIdtf,
     ScTemplateParams,
     ScTemplateResult,
+    ScTemplateResultSet,
 )
 from sc_client.models.sc_construction import ScLinkContentData
 
@@ -53,7 +62,19 @@ def set_reconnect_handler(**reconnect_kwargs) -> None:
     )
 
 
-def get_elements_types(*addrs: ScAddr) -> list[ScType]:
+def set_tracer(tracer) -> None:
+    tracing.set_tracer(tracer)
+
+
+def set_coalescing(is_enabled: bool) -> None:
+    session.set_coalescing(is_enabled)
+
+
+def set_recorder(recorder: recording.TrafficRecorder | None) -> None:
+    session.set_recorder(recorder)
+
+
+def get_elements_types(*addrs: ScAddr | ScAddrArray) -> list[ScType]:
     return session.execute(common.ClientCommand.GET_ELEMENTS_TYPES, *addrs)
 
 
@@ -64,8 +85,23 @@ def check_elements(*addrs: ScAddr) -> list[ScType]:
     return get_elements_types(*addrs)
 
 
-def generate_elements(constr: ScConstruction) -> list[ScAddr]:
-    return session.execute(common.ClientCommand.GENERATE_ELEMENTS, constr)
+def generate_elements(
+    constr: ScConstruction,
+    as_array: bool = False,
+    chunk_size: int = None,
+    window: int = PIPELINE_WINDOW,
+    deduplicate: bool = False,
+    deduplicate_links: bool = False,
+) -> list[ScAddr] | ScAddrArray:
+    if (deduplicate or deduplicate_links) and isinstance(constr, ScConstruction):
+        unique_constr, indices = constr.deduplicated(links=deduplicate_links)
+        addrs = generate_elements(unique_constr, as_array, chunk_size, window)
+        if as_array:
+            return ScAddrArray.from_values([addrs.values[index] for index in indices])
+        return [addrs[index] for index in indices]
+    if chunk_size is not None and isinstance(constr, ScConstruction) and len(constr) > chunk_size:
+        return session.execute_by_chunks(constr, chunk_size, window, as_array=as_array)
+    return session.execute(common.ClientCommand.GENERATE_ELEMENTS, constr, as_array=as_array)
 
 
 def create_elements(constr: ScConstruction) -> list[ScAddr]:
@@ -87,7 +123,7 @@ def create_elements_by_scs(text: SCsText) -> list[bool]:
     return generate_elements_by_scs(text)
 
 
-def erase_elements(*addrs: ScAddr) -> bool:
+def erase_elements(*addrs: ScAddr | ScAddrArray) -> bool:
     return session.execute(common.ClientCommand.ERASE_ELEMENTS, *addrs)
 
 
@@ -106,8 +142,22 @@ def get_link_content(*addr: ScAddr) -> list[ScLinkContent]:
     return session.execute(common.ClientCommand.GET_LINK_CONTENT, *addr)
 
 
-def search_links_by_contents(*contents: ScLinkContent | ScLinkContentData) -> list[list[ScAddr]]:
-    return session.execute(common.ClientCommand.SEARCH_LINKS_BY_CONTENT, *contents)
+def set_link_contents_stream(
+    contents: Iterable[ScLinkContent], window: int = CONTENT_PIPELINE_WINDOW
+) -> Iterator[bool]:
+    results = session.execute_many(common.ClientCommand.SET_LINK_CONTENTS, ((content,) for content in contents), window)
+    return (result for _, result in results)
+
+
+def get_link_contents_stream(addrs: Iterable[ScAddr], window: int = CONTENT_PIPELINE_WINDOW) -> Iterator[ScLinkContent]:
+    results = session.execute_many(common.ClientCommand.GET_LINK_CONTENT, ((addr,) for addr in addrs), window)
+    return (result[0] for _, result in results)
+
+
+def search_links_by_contents(
+    *contents: ScLinkContent | ScLinkContentData, as_array: bool = False
+) -> list[list[ScAddr]] | list[ScAddrArray]:
+    return session.execute(common.ClientCommand.SEARCH_LINKS_BY_CONTENT, *contents, as_array=as_array)
 
 
 def get_links_by_content(*contents: ScLinkContent | ScLinkContentData) -> list[list[ScAddr]]:
@@ -118,8 +168,10 @@ def get_links_by_content(*contents: ScLinkContent | ScLinkContentData) -> list[l
     return search_links_by_contents(*contents)
 
 
-def search_links_by_contents_substrings(*contents: ScLinkContent | ScLinkContentData) -> list[list[ScAddr]]:
-    return session.execute(common.ClientCommand.SEARCH_LINKS_BY_CONTENT_SUBSTRING, *contents)
+def search_links_by_contents_substrings(
+    *contents: ScLinkContent | ScLinkContentData, as_array: bool = False
+) -> list[list[ScAddr]] | list[ScAddrArray]:
+    return session.execute(common.ClientCommand.SEARCH_LINKS_BY_CONTENT_SUBSTRING, *contents, as_array=as_array)
 
 
 def get_links_by_content_substring(*contents: ScLinkContent | ScLinkContentData) -> list[list[ScAddr]]:
@@ -147,9 +199,52 @@ def resolve_keynodes(*params: ScIdtfResolveParams) -> list[ScAddr]:
 
 
 def search_by_template(
-    template: ScTemplate | str | ScTemplateIdtf | ScAddr, params: ScTemplateParams = None
-) -> list[ScTemplateResult]:
-    return session.execute(common.ClientCommand.SEARCH_BY_TEMPLATE, template, params)
+    template: ScTemplate | str | ScTemplateIdtf | ScAddr,
+    params: ScTemplateParams = None,
+    as_columns: bool = False,
+    project: Sequence[str | int] = None,
+    distinct: bool = False,
+    as_iterator: bool = False,
+) -> list[ScTemplateResult] | ScTemplateResultSet | Iterator[ScTemplateResult]:
+    return session.execute(
+        common.ClientCommand.SEARCH_BY_TEMPLATE,
+        template,
+        params,
+        as_columns=as_columns,
+        as_iterator=as_iterator,
+        project=project,
+        distinct=distinct,
+    )
+
+
+def search_by_template_batch(
+    template: ScTemplate | str | ScTemplateIdtf | ScAddr,
+    params_list: Iterable[ScTemplateParams],
+    window: int = PIPELINE_WINDOW,
+    ordered: bool = True,
+    as_columns: bool = False,
+    project: Sequence[str | int] = None,
+    distinct: bool = False,
+) -> Iterator[list[ScTemplateResult] | ScTemplateResultSet] | Iterator[Tuple[int, list[ScTemplateResult]]]:
+    template = _prepared(template)
+    results = session.execute_many(
+        common.ClientCommand.SEARCH_BY_TEMPLATE,
+        ((template, params) for params in params_list),
+        window,
+        ordered,
+        as_columns=as_columns,
+        project=project,
+        distinct=distinct,
+    )
+    if ordered:
+        return (result for _, result in results)
+    return results
+
+
+def _prepared(template: ScTemplate | str | ScTemplateIdtf | ScAddr) -> ScTemplate | str | ScTemplateIdtf | ScAddr:
+    if isinstance(template, ScTemplate) and template.prepared_payload is None:
+        template = copy.copy(template).prepare()
+    return template
 
 
 def template_search(
@@ -167,6 +262,22 @@ def generate_by_template(
     return session.execute(common.ClientCommand.GENERATE_BY_TEMPLATE, template, params)
 
 
+def generate_by_template_batch(
+    template: ScTemplate | str | ScTemplateIdtf | ScAddr,
+    params_list: Iterable[ScTemplateParams],
+    window: int = PIPELINE_WINDOW,
+    return_exceptions: bool = True,
+) -> list[ScTemplateResult | Exception]:
+    template = _prepared(template)
+    results = session.execute_many(
+        common.ClientCommand.GENERATE_BY_TEMPLATE,
+        ((template, params) for params in params_list),
+        window,
+        return_exceptions=return_exceptions,
+    )
+    return [result for _, result in results]
+
+
 def template_generate(
     template: ScTemplate | str | ScTemplateIdtf | ScAddr, params: ScTemplateParams = None
 ) -> ScTemplateResult:
@@ -1,8 +1,14 @@
-from sc_client import session
-from sc_client.client._payload_factory import PayloadFactory
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+from sc_client import session, tracing
+from sc_client.client._payload_factory import PayloadFactory, bind_construction_chunk, split_construction_payload
 from sc_client.client._response_processor import ResponseProcessor
-from sc_client.constants.common import ERRORS, MESSAGE, REF, ClientCommand, RequestType
+from sc_client.constants.common import ERRORS, MESSAGE, PAYLOAD, REF, ClientCommand, RequestType
 from sc_client.constants.exceptions import ServerError
+from sc_client.models import Response, ScConstruction
 
 
 class Executor:
@@ -27,9 +33,129 @@ class Executor:
         self.payload_factory = PayloadFactory()
         self.response_processor = ResponseProcessor()
 
-    def run(self, command_type: ClientCommand, *args):
-        payload = self.payload_factory.run(command_type, *args)
-        response = session.send_message(self._executor_mapper.get(command_type), payload)
+    def run(self, command_type: ClientCommand, *args, **options):
+        attributes = {tracing.COMMAND_ATTRIBUTE: command_type.name}
+        with tracing.start_span(tracing.EXECUTE_SPAN_NAME, attributes):
+            payload = self.payload_factory.run(command_type, *args)
+            response = session.send_message(self._executor_mapper.get(command_type), payload)
+            self._check_errors(response, payload)
+            return self.response_processor.run(command_type, response, *args, **options)
+
+    def run_many(
+        self,
+        command_type: ClientCommand,
+        args_list: Iterable[Tuple[Any, ...]],
+        window: int,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+        **options,
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Send a command for every args without waiting for responses, at most `window` of them are pending.
+
+        Yields `(index, result)` in order of args or as responses arrive. If `return_exceptions` is true,
+        errors of commands are yielded as results, otherwise the first one is raised.
+        """
+        if window < 1:
+            raise ValueError("Window must be positive")
+        request_type = self._executor_mapper.get(command_type)
+        pending: Dict[int, Tuple[int, Tuple[Any, ...], Any]] = {}
+        # requests in order of args for ordered results, command id is None if the request was not sent
+        order: Deque[Tuple[int, Optional[int], Optional[Exception]]] = deque()
+        args_iter = enumerate(args_list)
+        try:
+            while True:
+                while len(pending) < window:
+                    item = next(args_iter, None)
+                    if item is None:
+                        break
+                    index, args = item
+                    try:
+                        command_id, payload = self._post(command_type, request_type, args)
+                    except Exception as e:  # pylint: disable=broad-except
+                        if not return_exceptions:
+                            raise
+                        if ordered:
+                            order.append((index, None, e))
+                        else:
+                            yield index, e
+                        continue
+                    pending[command_id] = (index, args, payload)
+                    if ordered:
+                        order.append((index, command_id, None))
+                while order and order[0][1] is None:
+                    index, _, error = order.popleft()
+                    yield index, error
+                if not pending:
+                    return
+                if ordered:
+                    command_id, response = order[0][1], session.receive_message(order[0][1])
+                else:
+                    command_id, response = session.receive_any_message(pending)
+                if not response:
+                    return
+                index, args, payload = pending.pop(command_id)
+                if ordered:
+                    order.popleft()
+                try:
+                    self._check_errors(response, payload)
+                    result = self.response_processor.run(command_type, response, *args, **options)
+                except Exception as e:  # pylint: disable=broad-except
+                    if not return_exceptions:
+                        raise
+                    result = e
+                yield index, result
+        finally:
+            session.discard_messages(pending)
+
+    def run_by_chunks(self, constr: ScConstruction, chunk_size: int, window: int, **options):
+        """
+        Generate elements of the construction by chunks, at most `window` of them are pending.
+
+        A chunk is sent when chunks with elements referenced by it have been generated,
+        its refs to them are replaced by generated addrs.
+        """
+        if window < 1:
+            raise ValueError("Window must be positive")
+        command_type = ClientCommand.GENERATE_ELEMENTS
+        request_type = self._executor_mapper.get(command_type)
+        with tracing.start_span(tracing.EXECUTE_SPAN_NAME, {tracing.COMMAND_ATTRIBUTE: command_type.name}):
+            payload = self.payload_factory.run(command_type, constr)
+            chunks = split_construction_payload(payload, chunk_size)
+            addrs = [0] * len(payload)
+            is_generated = [False] * len(chunks)
+            pending: Dict[int, Tuple[int, list]] = {}
+            next_chunk = 0
+            try:
+                while next_chunk < len(chunks) or pending:
+                    while (
+                        next_chunk < len(chunks)
+                        and len(pending) < window
+                        and all(is_generated[dependency] for dependency in chunks[next_chunk].dependencies)
+                    ):
+                        chunk_payload = bind_construction_chunk(payload, chunks[next_chunk], addrs)
+                        pending[session.post_message(request_type, chunk_payload)] = (next_chunk, chunk_payload)
+                        next_chunk += 1
+                    command_id, response = session.receive_any_message(pending)
+                    if not response:
+                        return None
+                    chunk_index, chunk_payload = pending.pop(command_id)
+                    self._check_errors(response, chunk_payload)
+                    chunk = chunks[chunk_index]
+                    addrs[chunk.start : chunk.end] = response.get(PAYLOAD)
+                    is_generated[chunk_index] = True
+            finally:
+                session.discard_messages(pending)
+            response = Response(id=None, status=True, event=False, payload=addrs)
+            return self.response_processor.run(command_type, response, constr, **options)
+
+    def _post(self, command_type: ClientCommand, request_type: RequestType, args: Tuple[Any, ...]) -> Tuple[int, Any]:
+        with tracing.start_span(tracing.EXECUTE_SPAN_NAME, {tracing.COMMAND_ATTRIBUTE: command_type.name}):
+            payload = self.payload_factory.run(command_type, *args)
+            return session.post_message(request_type, payload), payload
+
+    @staticmethod
+    def _check_errors(response: Response, payload) -> None:
         if response.get(ERRORS):
             error_msgs = []
             errors = response.get(ERRORS)
@@ -41,4 +167,3 @@ class Executor:
                     error_msgs.append(error.get(MESSAGE) + payload_part)
             error_msgs = "\n".join(error_msgs)
             raise ServerError(error_msgs)
-        return self.response_processor.run(command_type, response, *args)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import json
 import re
-from typing import get_origin
+from typing import NamedTuple, Set, get_origin
 
-from sc_client._internal_utils import process_triple_item
+from sc_client._internal_utils import EncodedJson
 from sc_client.constants import common, exceptions
 from sc_client.models import (
     ScAddr,
+    ScAddrArray,
     ScConstruction,
     ScEventSubscription,
     ScEventSubscriptionParams,
@@ -19,7 +21,74 @@ from sc_client.models import (
     ScTemplateIdtf,
     ScTemplateParams,
 )
-from sc_client.models.sc_construction import ScLinkContentData
+from sc_client.models.sc_construction import BINARY_DATA_TYPES, ScLinkContentData
+
+
+def _addrs_payload(addrs: tuple[ScAddr | ScAddrArray, ...]) -> list[int]:
+    if len(addrs) == 1 and isinstance(addrs[0], ScAddrArray):
+        return addrs[0].values.tolist()
+    if not all(isinstance(addr, ScAddr) for addr in addrs):
+        raise exceptions.InvalidTypeError("expected object types: ScAddr")
+    return [addr.value for addr in addrs]
+
+
+class ConstructionChunk(NamedTuple):
+    start: int
+    end: int
+    dependencies: Set[int]
+
+
+def split_construction_payload(payload: list[dict], chunk_size: int) -> list[ConstructionChunk]:
+    """
+    Split generate elements payload into chunks of about `chunk_size` elements.
+
+    A chunk is extended until it includes all elements referenced forward by its connectors,
+    dependencies are indices of earlier chunks with referenced elements.
+    """
+    if chunk_size < 1:
+        raise exceptions.InvalidValueError("Chunk size must be positive")
+    chunks = []
+    chunk_of_element = []
+    start = 0
+    while start < len(payload):
+        end = min(start + chunk_size, len(payload))
+        dependencies = set()
+        index = start
+        while index < end:
+            part = payload[index]
+            if part[common.ELEMENT] == common.Elements.CONNECTOR:
+                for connector_end in (part[common.SOURCE], part[common.TARGET]):
+                    if connector_end[common.TYPE] == common.Types.REF:
+                        ref = connector_end[common.VALUE]
+                        if ref < start:
+                            dependencies.add(chunk_of_element[ref])
+                        elif ref >= end:
+                            end = ref + 1
+            index += 1
+        chunk_of_element.extend([len(chunks)] * (end - start))
+        chunks.append(ConstructionChunk(start, end, dependencies))
+        start = end
+    return chunks
+
+
+def bind_construction_chunk(payload: list[dict], chunk: ConstructionChunk, addrs: list[int]) -> list[dict]:
+    """Payload of the chunk with refs to earlier chunks replaced by their generated addrs"""
+    if not chunk.start:
+        return payload[: chunk.end]
+    chunk_payload = []
+    for part in payload[chunk.start : chunk.end]:
+        if part[common.ELEMENT] == common.Elements.CONNECTOR:
+            part = dict(part)
+            for key in (common.SOURCE, common.TARGET):
+                connector_end = part[key]
+                if connector_end[common.TYPE] == common.Types.REF:
+                    ref = connector_end[common.VALUE]
+                    if ref < chunk.start:
+                        part[key] = {common.TYPE: common.Types.ADDR, common.VALUE: addrs[ref]}
+                    else:
+                        part[key] = {common.TYPE: common.Types.REF, common.VALUE: ref - chunk.start}
+        chunk_payload.append(part)
+    return chunk_payload
 
 
 class BasePayloadCreator:
@@ -34,41 +103,41 @@ class GenerateElementsPayloadCreator(BasePayloadCreator):
     def __call__(self, constr: ScConstruction, *_):
         if not isinstance(constr, ScConstruction):
             raise exceptions.InvalidTypeError("expected object types: ScConstruction")
+        aliases = constr.aliases
+        node, link = common.Elements.NODE, common.Elements.LINK
         payload = []
-        for command in constr.commands:
-            if command.el_type.is_link():
-                payload_part = {
-                    common.ELEMENT: common.Elements.LINK,
-                    common.TYPE: command.el_type.value,
-                    common.CONTENT: command.data.get(common.CONTENT),
-                    common.CONTENT_TYPE: command.data.get(common.TYPE),
-                }
-                payload.append(payload_part)
-
-            elif command.el_type.is_node():
-                payload_part = {
-                    common.ELEMENT: common.Elements.NODE,
-                    common.TYPE: command.el_type.value,
-                }
-                payload.append(payload_part)
-
-            elif command.el_type.is_connector():
-
-                def solve_adj(obj: ScAddr | str):
-                    if isinstance(obj, ScAddr):
-                        return {common.TYPE: common.Types.ADDR, common.VALUE: obj.value}
-                    return {
-                        common.TYPE: common.Types.REF,
-                        common.VALUE: constr.get_index(obj),
+        append = payload.append
+        for element, sc_type, source, target, content, content_type in zip(
+            constr.elements, constr.types, constr.sources, constr.targets, constr.contents, constr.content_types
+        ):
+            if element == node:
+                append({common.ELEMENT: node, common.TYPE: sc_type.value})
+            elif element == link:
+                append(
+                    {
+                        common.ELEMENT: link,
+                        common.TYPE: sc_type.value,
+                        common.CONTENT: content,
+                        common.CONTENT_TYPE: content_type,
                     }
-
-                payload_part = {
-                    common.ELEMENT: common.Elements.CONNECTOR,
-                    common.TYPE: command.el_type.value,
-                    common.SOURCE: solve_adj(command.data.get(common.SOURCE)),
-                    common.TARGET: solve_adj(command.data.get(common.TARGET)),
-                }
-                payload.append(payload_part)
+                )
+            else:
+                if isinstance(source, ScAddr):
+                    source = {common.TYPE: common.Types.ADDR, common.VALUE: source.value}
+                else:
+                    source = {common.TYPE: common.Types.REF, common.VALUE: aliases[source]}
+                if isinstance(target, ScAddr):
+                    target = {common.TYPE: common.Types.ADDR, common.VALUE: target.value}
+                else:
+                    target = {common.TYPE: common.Types.REF, common.VALUE: aliases[target]}
+                append(
+                    {
+                        common.ELEMENT: common.Elements.CONNECTOR,
+                        common.TYPE: sc_type.value,
+                        common.SOURCE: source,
+                        common.TARGET: target,
+                    }
+                )
         return payload
 
 
@@ -97,17 +166,13 @@ class GenerateElementsBySCsPayloadCreator(BasePayloadCreator):
 
 
 class GetElementsTypesPayloadCreator(BasePayloadCreator):
-    def __call__(self, *addrs: ScAddr):
-        if not all(isinstance(addr, ScAddr) for addr in addrs):
-            raise exceptions.InvalidTypeError("expected object types: ScAddr")
-        return [addr.value for addr in addrs]
+    def __call__(self, *addrs: ScAddr | ScAddrArray):
+        return _addrs_payload(addrs)
 
 
 class EraseElementsPayloadCreator(BasePayloadCreator):
-    def __call__(self, *addrs: ScAddr):
-        if not all(isinstance(addr, ScAddr) for addr in addrs):
-            raise exceptions.InvalidTypeError("expected object types: ScAddr")
-        return [addr.value for addr in addrs]
+    def __call__(self, *addrs: ScAddr | ScAddrArray):
+        return _addrs_payload(addrs)
 
 
 class SetLinkContentPayloadCreator(BasePayloadCreator):
@@ -118,7 +183,7 @@ class SetLinkContentPayloadCreator(BasePayloadCreator):
             {
                 common.COMMAND: common.CommandTypes.SET,
                 common.TYPE: content.type_to_str(),
-                common.DATA: content.data,
+                common.DATA: content.encoded_data,
                 common.ADDR: content.addr.value,
             }
             for content in contents
@@ -142,8 +207,8 @@ class GetLinkContentPayloadCreator(BasePayloadCreator):
 
 class SearchLinksByContentPayloadCreator(BasePayloadCreator):
     def __call__(self, *contents: ScLinkContent | ScLinkContentData):
-        if not all(isinstance(content, (ScLinkContent, str, int, float)) for content in contents):
-            raise exceptions.InvalidTypeError("expected object types: ScLinkContent, str or int")
+        if not all(isinstance(content, (ScLinkContent, str, int, float, *BINARY_DATA_TYPES)) for content in contents):
+            raise exceptions.InvalidTypeError("expected object types: ScLinkContent, str, int, float or bytes")
         link_contents = []
         for content in contents:
             if isinstance(content, ScLinkContent):
@@ -152,6 +217,8 @@ class SearchLinksByContentPayloadCreator(BasePayloadCreator):
                 link_contents.append(ScLinkContent(content, ScLinkContentType.STRING))
             elif isinstance(content, int):
                 link_contents.append(ScLinkContent(content, ScLinkContentType.INT))
+            elif isinstance(content, BINARY_DATA_TYPES):
+                link_contents.append(ScLinkContent(content, ScLinkContentType.BINARY))
             else:  # float
                 link_contents.append(ScLinkContent(content, ScLinkContentType.FLOAT))
 
@@ -163,7 +230,7 @@ class SearchLinksByContentPayloadCreator(BasePayloadCreator):
     def _form_payload_content(self, content):
         return {
             common.COMMAND: common.CommandTypes.SEARCH,
-            common.DATA: content.data,
+            common.DATA: content.encoded_data,
         }
 
 
@@ -171,7 +238,7 @@ class SearchLinksByContentSubstringPayloadCreator(SearchLinksByContentPayloadCre
     def _form_payload_content(self, content):
         return {
             common.COMMAND: common.CommandTypes.SEARCH_LINKS_BY_CONTENT_SUBSTRING,
-            common.DATA: content.data,
+            common.DATA: content.encoded_data,
         }
 
 
@@ -179,7 +246,7 @@ class SearchLinksContentsByContentSubstringPayloadCreator(SearchLinksByContentPa
     def _form_payload_content(self, content):
         return {
             common.COMMAND: common.CommandTypes.SEARCH_LINKS_CONTENTS_BY_CONTENT_SUBSTRING,
-            common.DATA: content.data,
+            common.DATA: content.encoded_data,
         }
 
 
@@ -223,8 +290,10 @@ class TemplatePayloadCreator(BasePayloadCreator):
             payload_template = {common.TYPE: common.Types.IDTF, common.VALUE: template}
         elif isinstance(template, str):
             payload_template = template
+        elif template.prepared_payload is not None:
+            payload_template = EncodedJson(template.prepared_payload)
         else:
-            payload_template = self._process_template(template)
+            payload_template = template.to_payload()
 
         payload_params = {}
         if params is not None:
@@ -235,15 +304,11 @@ class TemplatePayloadCreator(BasePayloadCreator):
                     payload_params.update({alias: addr.value})
                 else:
                     payload_params.update({alias: str(addr)})
+        if isinstance(payload_template, EncodedJson):
+            payload_params = json.dumps(payload_params)
+            return EncodedJson(f'{{"{common.TEMPLATE}": {payload_template}, "{common.PARAMS}": {payload_params}}}')
         return {common.TEMPLATE: payload_template, common.PARAMS: payload_params}
 
-    def _process_template(self, template: ScTemplate):
-        payload_template = []
-        for triple in template.triple_list:
-            items = [triple.source, triple.connector, triple.target]
-            payload_template.append([process_triple_item(item) for item in items])
-        return payload_template
-
 
 class CreateEventSubscriptionsPayloadCreator(BasePayloadCreator):
     def __call__(self, *event_subscription_params: ScEventSubscriptionParams):
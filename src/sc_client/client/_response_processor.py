@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator, Sequence
+
 from sc_client import session
+from sc_client._internal_utils import AddrsRows
 from sc_client.constants import common as c
+from sc_client.constants.exceptions import InvalidValueError
 from sc_client.constants.sc_types import ScType
 from sc_client.models import (
     Response,
     ScAddr,
+    ScAddrArray,
     ScEventSubscription,
     ScEventSubscriptionParams,
     ScLinkContent,
     ScLinkContentType,
     ScTemplateResult,
+    ScTemplateResultSet,
 )
+from sc_client.models.sc_addr import addrs_from_values
 
 
 class BaseResponseProcessor:
@@ -23,8 +31,10 @@ class BaseResponseProcessor:
 
 
 class GenerateElementsResponseProcessor(BaseResponseProcessor):
-    def __call__(self, response: Response, *_) -> list[ScAddr]:
-        return [ScAddr(addr_value) for addr_value in response.get(c.PAYLOAD)]
+    def __call__(self, response: Response, *_, as_array: bool = False) -> list[ScAddr] | ScAddrArray:
+        if as_array:
+            return ScAddrArray.from_values(response.get(c.PAYLOAD))
+        return addrs_from_values(response.get(c.PAYLOAD))
 
 
 class GenerateElementsBySCsResponseProcessor(BaseResponseProcessor):
@@ -53,15 +63,16 @@ class GetLinkContentResponseProcessor(BaseResponseProcessor):
         result = []
         for link in response_payload:
             str_type: str = link.get(c.TYPE)
-            result.append(ScLinkContent(link.get(c.VALUE), ScLinkContentType[str_type.upper()]))
+            result.append(ScLinkContent.from_encoded(link.get(c.VALUE), ScLinkContentType[str_type.upper()]))
         return result
 
 
 class SearchLinksByContentResponseProcessor(BaseResponseProcessor):
-    def __call__(self, response: Response, *_) -> list[list[ScAddr]]:
+    def __call__(self, response: Response, *_, as_array: bool = False) -> list[list[ScAddr]] | list[ScAddrArray]:
         response_payload = response.get(c.PAYLOAD)
         if response_payload:
-            return [[ScAddr(addr_value) for addr_value in addr_list] for addr_list in response_payload]
+            to_addrs = ScAddrArray.from_values if as_array else addrs_from_values
+            return [to_addrs(addr_list) for addr_list in response_payload]
         return response_payload
 
 
@@ -79,21 +90,66 @@ class ResolveKeynodesResponseProcessor(BaseResponseProcessor):
     def __call__(self, response: Response, *_) -> list[ScAddr]:
         response_payload = response.get(c.PAYLOAD)
         if response_payload:
-            return [ScAddr(addr_value) for addr_value in response_payload]
+            return addrs_from_values(response_payload)
         return response
 
 
 class SearchByTemplateResponseProcessor(BaseResponseProcessor):
-    def __call__(self, response: Response, *_) -> list[ScTemplateResult]:
-        result = []
-        if response.get(c.STATUS):
-            response_payload = response.get(c.PAYLOAD)
-            aliases = response_payload.get(c.ALIASES)
-            all_addrs = response_payload.get(c.ADDRS)
-            for addrs_list in all_addrs:
-                addrs = [ScAddr(addr) for addr in addrs_list]
-                result.append(ScTemplateResult(addrs, aliases))
-        return result
+    def __call__(
+        self,
+        response: Response,
+        *_,
+        as_columns: bool = False,
+        as_iterator: bool = False,
+        project: Sequence[str | int] | None = None,
+        distinct: bool = False,
+    ) -> list[ScTemplateResult] | ScTemplateResultSet | Iterator[ScTemplateResult]:
+        if not response.get(c.STATUS):
+            if as_columns:
+                return ScTemplateResultSet([], {})
+            return iter(()) if as_iterator else []
+        response_payload = response.get(c.PAYLOAD)
+        aliases = response_payload.get(c.ALIASES)
+        all_addrs = response_payload.get(c.ADDRS)
+        # rows of large responses are decoded by chunks, so they are processed chunk by chunk
+        chunks = all_addrs.chunks() if isinstance(all_addrs, AddrsRows) else (all_addrs,)
+        if project is not None:
+            get_projected, aliases = self._projection(aliases, project)
+            chunks = (list(map(get_projected, rows)) for rows in chunks)
+        if distinct:
+            chunks = self._distinct(chunks)
+        if as_columns:
+            return ScTemplateResultSet.from_row_chunks(chunks, aliases)
+        results = (ScTemplateResult.from_values(addrs_list, aliases) for rows in chunks for addrs_list in rows)
+        return results if as_iterator else list(results)
+
+    @staticmethod
+    def _projection(
+        aliases: dict[str, int], project: Sequence[str | int]
+    ) -> tuple[Callable[[list[int]], tuple[int, ...]], dict[str, int]]:
+        indices = []
+        projected_aliases = {}
+        for item in project:
+            if isinstance(item, str):
+                if item not in aliases:
+                    raise InvalidValueError(f"Unknown alias `{item}` in projection")
+                projected_aliases[item] = len(indices)
+                item = aliases[item]
+            indices.append(item)
+        if not indices:
+            raise InvalidValueError("Projection must have at least one alias or index")
+        if len(indices) == 1:
+            index = indices[0]
+            return lambda addrs: (addrs[index],), projected_aliases
+        return itemgetter(*indices), projected_aliases
+
+    @staticmethod
+    def _distinct(chunks: Iterable[Sequence[Sequence[int]]]) -> Iterator[list[tuple[int, ...]]]:
+        seen = set()
+        for rows in chunks:
+            rows = [addrs for addrs in dict.fromkeys(map(tuple, rows)) if addrs not in seen]
+            seen.update(rows)
+            yield rows
 
 
 class GenerateByTemplateResponseProcessor(BaseResponseProcessor):
@@ -103,8 +159,7 @@ class GenerateByTemplateResponseProcessor(BaseResponseProcessor):
             response_payload = response.get(c.PAYLOAD)
             aliases = response_payload.get(c.ALIASES)
             addrs_list = response_payload.get(c.ADDRS)
-            addrs = [ScAddr(addr) for addr in addrs_list]
-            result = ScTemplateResult(addrs, aliases)
+            result = ScTemplateResult.from_values(addrs_list, aliases)
         return result
 
 
@@ -11,3 +11,8 @@ SERVER_ESTABLISH_CONNECTION_TIME = 0.1
 SERVER_RECONNECT_RETRIES = 5
 SERVER_RECONNECT_RETRY_DELAY = 2.0
 MAX_PAYLOAD_SIZE = 32 * 1024 * 1024  # 32 Mb max websocket
+PIPELINE_WINDOW = 64
+CONTENT_PIPELINE_WINDOW = 4
+INCREMENTAL_DECODING_MIN_SIZE = 1024 * 1024
+ADDRS_ROWS_CHUNK_SIZE = 64 * 1024
+DECODER_POOL_SIZE = 2
@@ -0,0 +1,115 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+from __future__ import annotations
+
+from array import array
+from itertools import compress
+from typing import Any, Dict, Iterable, Sequence, Union
+
+from sc_client.constants.exceptions import InvalidTypeError
+from sc_client.constants.sc_type import bitmasks
+from sc_client.constants.sc_type.sc_type import ScType
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+ScTypeValues = Union[Sequence[ScType], Sequence[int], Any]
+
+SUBTYPES = {
+    "node": bitmasks.SC_TYPE_NODE,
+    "link": bitmasks.SC_TYPE_NODE_LINK,
+    "connector": bitmasks.SC_TYPE_CONNECTOR,
+    "common_edge": bitmasks.SC_TYPE_COMMON_EDGE,
+    "arc": bitmasks.SC_TYPE_ARC,
+    "common_arc": bitmasks.SC_TYPE_COMMON_ARC,
+    "membership_arc": bitmasks.SC_TYPE_MEMBERSHIP_ARC,
+    "const": bitmasks.SC_TYPE_CONST,
+    "var": bitmasks.SC_TYPE_VAR,
+    "pos": bitmasks.SC_TYPE_POS_ARC,
+    "neg": bitmasks.SC_TYPE_NEG_ARC,
+    "fuz": bitmasks.SC_TYPE_FUZ_ARC,
+    "perm": bitmasks.SC_TYPE_PERM_ARC,
+    "temp": bitmasks.SC_TYPE_TEMP_ARC,
+    "actual": bitmasks.SC_TYPE_ACTUAL_ARC,
+    "inactual": bitmasks.SC_TYPE_INACTUAL_ARC,
+    "tuple": bitmasks.SC_TYPE_NODE_TUPLE,
+    "structure": bitmasks.SC_TYPE_NODE_STRUCTURE,
+    "role": bitmasks.SC_TYPE_NODE_ROLE,
+    "non_role": bitmasks.SC_TYPE_NODE_NON_ROLE,
+    "class": bitmasks.SC_TYPE_NODE_CLASS,
+    "superclass": bitmasks.SC_TYPE_NODE_SUPERCLASS,
+    "material": bitmasks.SC_TYPE_NODE_MATERIAL,
+}
+DEFAULT_CLASSES = ("node", "link", "connector", "arc", "membership_arc", "const", "var")
+
+
+def _is_numpy_used(use_numpy: bool | None) -> bool:
+    if use_numpy is None:
+        return numpy is not None
+    if use_numpy and numpy is None:
+        raise ImportError("NumPy is not installed")
+    return use_numpy
+
+
+def _to_ints(values: ScTypeValues) -> Sequence[int]:
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return values.tolist()
+    if isinstance(values, array) or not values or not isinstance(values[0], ScType):
+        return values
+    return [sc_type.value for sc_type in values]
+
+
+def _to_numpy(values: ScTypeValues):
+    if isinstance(values, numpy.ndarray):
+        return values.astype(numpy.uint64, copy=False)
+    return numpy.asarray(_to_ints(values), dtype=numpy.uint64)
+
+
+def _get_subtype(name: str) -> int:
+    subtype = SUBTYPES.get(name)
+    if subtype is None:
+        raise InvalidTypeError(f"Unknown sc-type class `{name}`, expected one of: {', '.join(SUBTYPES)}")
+    return subtype
+
+
+def classify(
+    values: ScTypeValues, classes: Iterable[str] = DEFAULT_CLASSES, use_numpy: bool | None = None
+) -> Dict[str, Any]:
+    """
+    Boolean masks of sc-types having every class, e.g. `classify(types)["node"][i]` is `types[i].is_node()`.
+
+    Values can be ScTypes or their int values. Masks are NumPy arrays if NumPy is installed, otherwise lists.
+    """
+    subtypes = {name: _get_subtype(name) for name in classes}
+    if _is_numpy_used(use_numpy):
+        numpy_values = _to_numpy(values)
+        return {name: (numpy_values & subtype) == subtype for name, subtype in subtypes.items()}
+    int_values = _to_ints(values)
+    distinct_values = set(int_values)
+    masks = {}
+    for name, subtype in subtypes.items():
+        matched = {value for value in distinct_values if value & subtype == subtype}
+        masks[name] = [value in matched for value in int_values]
+    return masks
+
+
+def partition(
+    values: ScTypeValues, classes: Iterable[str] = DEFAULT_CLASSES, use_numpy: bool | None = None
+) -> Dict[str, Any]:
+    """
+    Indices of sc-types having every class, e.g. `partition(types)["link"]` are indices of links in `types`.
+
+    Indices are NumPy arrays if NumPy is installed, otherwise arrays of unsigned ints.
+    """
+    is_numpy_used = _is_numpy_used(use_numpy)
+    masks = classify(values, classes, is_numpy_used)
+    if is_numpy_used:
+        return {name: numpy.flatnonzero(mask) for name, mask in masks.items()}
+    indices = range(len(values))
+    return {name: array("Q", compress(indices, mask)) for name, mask in masks.items()}
@@ -1,29 +1,102 @@
 from __future__ import annotations
 
 import warnings
+from functools import lru_cache
 
 from sc_client.constants.exceptions import InvalidTypeError
 from sc_client.constants.sc_type import bitmasks
 
+_MERGE_CACHE_SIZE = 4096
+# hashes of ScTypes differ from hashes of equal ints and ScAddrs, so they are rarely compared in containers
+_HASH_SALT = 0x5C7E5A17
+_FLAG_SUBTYPES = []
+
+
+def _flag(subtype: int) -> int:
+    _FLAG_SUBTYPES.append(subtype)
+    return 1 << (len(_FLAG_SUBTYPES) - 1)
+
+
+_NODE = _flag(bitmasks.SC_TYPE_NODE)
+_CONNECTOR = _flag(bitmasks.SC_TYPE_CONNECTOR)
+_COMMON_EDGE = _flag(bitmasks.SC_TYPE_COMMON_EDGE)
+_ARC = _flag(bitmasks.SC_TYPE_ARC)
+_COMMON_ARC = _flag(bitmasks.SC_TYPE_COMMON_ARC)
+_MEMBERSHIP_ARC = _flag(bitmasks.SC_TYPE_MEMBERSHIP_ARC)
+_LINK = _flag(bitmasks.SC_TYPE_NODE_LINK)
+_CONST = _flag(bitmasks.SC_TYPE_CONST)
+_VAR = _flag(bitmasks.SC_TYPE_VAR)
+_POS = _flag(bitmasks.SC_TYPE_POS_ARC)
+_NEG = _flag(bitmasks.SC_TYPE_NEG_ARC)
+_FUZ = _flag(bitmasks.SC_TYPE_FUZ_ARC)
+_PERM = _flag(bitmasks.SC_TYPE_PERM_ARC)
+_TEMP = _flag(bitmasks.SC_TYPE_TEMP_ARC)
+_ACTUAL = _flag(bitmasks.SC_TYPE_ACTUAL_ARC)
+_INACTUAL = _flag(bitmasks.SC_TYPE_INACTUAL_ARC)
+_TUPLE = _flag(bitmasks.SC_TYPE_NODE_TUPLE)
+_STRUCTURE = _flag(bitmasks.SC_TYPE_NODE_STRUCTURE)
+_ROLE = _flag(bitmasks.SC_TYPE_NODE_ROLE)
+_NON_ROLE = _flag(bitmasks.SC_TYPE_NODE_NON_ROLE)
+_CLASS = _flag(bitmasks.SC_TYPE_NODE_CLASS)
+_SUPERCLASS = _flag(bitmasks.SC_TYPE_NODE_SUPERCLASS)
+_MATERIAL = _flag(bitmasks.SC_TYPE_NODE_MATERIAL)
+_HAS_CONSTANCY = 1 << len(_FLAG_SUBTYPES)
+
+
+def _compute_flags(value: int) -> int:
+    flags = _HAS_CONSTANCY if value & bitmasks.SC_TYPE_CONSTANCY_MASK else 0
+    for bit, subtype in enumerate(_FLAG_SUBTYPES):
+        if value & subtype == subtype:
+            flags |= 1 << bit
+    return flags
+
 
 class ScType:
-    def __init__(self, value: int = 0):
+    """
+    Type of sc-element. Instances are immutable and interned: ScType with the same value is the same object,
+    and results of `is_*` checks are computed once per value.
+    """
+
+    __slots__ = ("value", "_flags")
+    _instances: dict[int, ScType] = {}
+
+    def __new__(cls, value: int | ScType = 0) -> ScType:
+        instance = cls._instances.get(value) if value.__class__ is int else None
+        if instance is not None:
+            return instance
         if not isinstance(value, (ScType, int)):
             raise InvalidTypeError("You should use int or ScType type for ScType initialization")
         if isinstance(value, ScType):
             value = value.value
-        self.value = value
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "value", value)
+        object.__setattr__(instance, "_flags", _compute_flags(value))
+        return cls._instances.setdefault(value, instance)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("ScType is immutable")
+
+    def __reduce__(self) -> tuple:
+        return ScType, (self.value,)
+
+    def __copy__(self) -> ScType:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> ScType:
+        return self
 
     def __repr__(self) -> str:
         return f"ScType({hex(self.value)})"
 
     def __hash__(self) -> int:
-        return hash((self.value, self.__class__))
+        return hash(self.value) ^ _HASH_SALT
 
     def __rshift__(self, alias: str) -> tuple[ScType, str]:
         return self, alias
 
     def __eq__(self, other: ScType) -> bool:
+        if self is other:
+            return True
         if isinstance(other, ScType):
             return self.value == other.value
         return NotImplemented
@@ -32,91 +105,91 @@ class ScType:
         return self.value != 0
 
     def has_constancy(self) -> bool:
-        return (self.value & bitmasks.SC_TYPE_CONSTANCY_MASK) != 0
+        return self._flags & _HAS_CONSTANCY != 0
 
     def _has_subtype(self, subtype) -> bool:
         return (self.value & subtype) == subtype
 
     def is_node(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_NODE)
+        return self._flags & _NODE != 0
 
     def is_connector(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_CONNECTOR)
+        return self._flags & _CONNECTOR != 0
 
     def is_edge(self) -> bool:
         warnings.warn("ScType `is_edge` method is deprecated. Use `is_connector` method instead.", DeprecationWarning)
         return self.is_connector()
 
     def is_common_edge(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_COMMON_EDGE)
+        return self._flags & _COMMON_EDGE != 0
 
     def is_arc(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_ARC)
+        return self._flags & _ARC != 0
 
     def is_common_arc(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_COMMON_ARC)
+        return self._flags & _COMMON_ARC != 0
 
     def is_membership_arc(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_MEMBERSHIP_ARC)
+        return self._flags & _MEMBERSHIP_ARC != 0
 
     def is_link(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_NODE_LINK)
+        return self._flags & _LINK != 0
 
     def is_const(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_CONST)
+        return self._flags & _CONST != 0
 
     def is_var(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_VAR)
+        return self._flags & _VAR != 0
 
     def is_pos(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_POS_ARC)
+        return self._flags & _POS != 0
 
     def is_neg(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_NEG_ARC)
+        return self._flags & _NEG != 0
 
     def is_fuz(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_FUZ_ARC)
+        return self._flags & _FUZ != 0
 
     def is_perm(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_PERM_ARC)
+        return self._flags & _PERM != 0
 
     def is_temp(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_TEMP_ARC)
+        return self._flags & _TEMP != 0
 
     def is_actual(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_ACTUAL_ARC)
+        return self._flags & _ACTUAL != 0
 
     def is_inactual(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_INACTUAL_ARC)
+        return self._flags & _INACTUAL != 0
 
     def is_tuple(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_NODE_TUPLE)
+        return self._flags & _TUPLE != 0
 
     def is_structure(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_NODE_STRUCTURE)
+        return self._flags & _STRUCTURE != 0
 
     def is_struct(self) -> bool:
         warnings.warn("ScType `is_struct` method is deprecated. Use `is_structure` method instead.", DeprecationWarning)
         return self.is_structure()
 
     def is_role(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_NODE_ROLE)
+        return self._flags & _ROLE != 0
 
     def is_non_role(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_NODE_NON_ROLE)
+        return self._flags & _NON_ROLE != 0
 
     def is_norole(self) -> bool:
         warnings.warn("ScType `is_norole` method is deprecated. Use `is_non_role` method instead.", DeprecationWarning)
         return self.is_non_role()
 
     def is_class(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_NODE_CLASS)
+        return self._flags & _CLASS != 0
 
     def is_superclass(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_NODE_SUPERCLASS)
+        return self._flags & _SUPERCLASS != 0
 
     def is_material(self) -> bool:
-        return self._has_subtype(bitmasks.SC_TYPE_NODE_MATERIAL)
+        return self._flags & _MATERIAL != 0
 
     def is_valid(self) -> bool:
         return self.__bool__()
@@ -124,84 +197,97 @@ class ScType:
     def is_equal(self, other: ScType) -> bool:
         return self.__eq__(other)
 
-    @staticmethod
-    def _is_not_compatible_by_mask(self_type: int, new_type: int, mask):
-        subtype = self_type & mask
-        new_subtype = new_type & mask
-        return subtype != bitmasks.SC_TYPE_UNKNOWN and subtype != new_subtype
+    def _is_extendable_to(self, new_type: ScType) -> bool:
+        return _is_extendable(self.value, new_type.value)
 
-    def _is_extendable_to(
-        self, new_type: ScType
-    ):  # it is equal to `sc_storage_is_type_extendable_to` in the sc-machine
-        self_value = self.value
-        new_value = new_type.value
+    def merge(self, other: ScType) -> ScType:
+        merged = _merge(self.value, other.value)
+        if merged is None:
+            raise InvalidTypeError(f"Type `{self}` can not be extended to `{other}`.")
+        return merged
 
-        if ScType._is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_ELEMENT_MASK):
-            return False
-        if ScType._is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_CONSTANCY_MASK):
+    def change_const(self, is_const: bool) -> ScType:
+        v = self.value & ~bitmasks.SC_TYPE_CONSTANCY_MASK
+        return ScType(v | (bitmasks.SC_TYPE_CONST if is_const else bitmasks.SC_TYPE_VAR))
+
+
+def _is_not_compatible_by_mask(self_type: int, new_type: int, mask: int) -> bool:
+    subtype = self_type & mask
+    new_subtype = new_type & mask
+    return subtype != bitmasks.SC_TYPE_UNKNOWN and subtype != new_subtype
+
+
+@lru_cache(maxsize=_MERGE_CACHE_SIZE)
+def _is_extendable(
+    self_value: int, new_value: int
+) -> bool:  # it is equal to `sc_storage_is_type_extendable_to` in the sc-machine
+    self_type = ScType(self_value)
+    new_type = ScType(new_value)
+
+    if _is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_ELEMENT_MASK):
+        return False
+    if _is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_CONSTANCY_MASK):
+        return False
+
+    if self_type.is_link():
+        if not new_type.is_link():
             return False
 
-        if self.is_link():
-            if not new_type.is_link():
-                return False
+        self_value &= ~bitmasks.SC_TYPE_NODE_LINK
+        new_value &= ~bitmasks.SC_TYPE_NODE_LINK
 
-            self_value &= ~bitmasks.SC_TYPE_NODE_LINK
-            new_value &= ~bitmasks.SC_TYPE_NODE_LINK
+        if _is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_NODE_LINK_MASK):
+            return False
 
-            if ScType._is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_NODE_LINK_MASK):
-                return False
+    elif self_type.is_node():
+        if not new_type.is_node():
+            return False
 
-        elif self.is_node():
-            if not new_type.is_node():
-                return False
+        self_value &= ~bitmasks.SC_TYPE_NODE
+        new_value &= ~bitmasks.SC_TYPE_NODE
 
-            self_value &= ~bitmasks.SC_TYPE_NODE
-            new_value &= ~bitmasks.SC_TYPE_NODE
+        if _is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_NODE_MASK):
+            return False
 
-            if ScType._is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_NODE_MASK):
-                return False
+    elif self_type.is_connector():
+        if not new_type.is_connector():
+            return False
 
-        elif self.is_connector():
-            if not new_type.is_connector():
-                return False
+        if _is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_CONNECTOR_MASK):
+            if self_type.is_common_edge():
+                if not new_type.is_common_edge():
+                    return False
+            elif self_type.is_arc():
+                if not new_type.is_arc():
+                    return False
 
-            if ScType._is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_CONNECTOR_MASK):
-                if self.is_common_edge():
-                    if not new_type.is_common_edge():
+                if self_type.is_common_arc():
+                    if not new_type.is_common_arc():
                         return False
-                elif self.is_arc():
-                    if not new_type.is_arc():
+                elif self_type.is_membership_arc():
+                    if not new_type.is_membership_arc():
                         return False
 
-                    if self.is_common_arc():
-                        if not new_type.is_common_arc():
-                            return False
-                    elif self.is_membership_arc():
-                        if not new_type.is_membership_arc():
-                            return False
-
-            self_value &= ~bitmasks.SC_TYPE_CONNECTOR_MASK
-            new_value &= ~bitmasks.SC_TYPE_CONNECTOR_MASK
+        self_value &= ~bitmasks.SC_TYPE_CONNECTOR_MASK
+        new_value &= ~bitmasks.SC_TYPE_CONNECTOR_MASK
 
-            if ScType._is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_ACTUALITY_MASK):
-                return False
+        if _is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_ACTUALITY_MASK):
+            return False
 
-            if ScType._is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_PERMANENCY_MASK):
-                return False
+        if _is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_PERMANENCY_MASK):
+            return False
 
-            if ScType._is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_POSITIVITY_MASK):
-                return False
+        if _is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_POSITIVITY_MASK):
+            return False
 
-            if ScType._is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_FUZ_ARC):
-                return False
+        if _is_not_compatible_by_mask(self_value, new_value, bitmasks.SC_TYPE_FUZ_ARC):
+            return False
 
-        return True
+    return True
 
-    def merge(self, other: ScType) -> ScType:
-        if not self._is_extendable_to(other):
-            raise InvalidTypeError(f"Type `{self}` can not be extended to `{other}`.")
-        return ScType(self.value | other.value)
 
-    def change_const(self, is_const: bool) -> ScType:
-        v = self.value & ~bitmasks.SC_TYPE_CONSTANCY_MASK
-        return ScType(v | (bitmasks.SC_TYPE_CONST if is_const else bitmasks.SC_TYPE_VAR))
+@lru_cache(maxsize=_MERGE_CACHE_SIZE)
+def _merge(self_value: int, other_value: int) -> ScType | None:
+    if not _is_extendable(self_value, other_value):
+        return None
+    return ScType(self_value | other_value)
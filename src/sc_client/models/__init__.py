@@ -1,4 +1,5 @@
 from .sc_addr import ScAddr
+from .sc_addr_array import ScAddrArray
 from .sc_construction import (
     Response,
     ScConstruction,
@@ -18,4 +19,5 @@ from .sc_template import (
     ScTemplateValue,
     ScTemplateValueItem,
 )
+from .sc_template_result_set import ScTemplateResultSet
 from .scs import SCs, SCsText
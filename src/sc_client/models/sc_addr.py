@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+from typing import Iterable
+
 from sc_client.constants.exceptions import InvalidTypeError
 
+_new_object = object.__new__
+# hashes of ScAddrs differ from hashes of equal ints and ScTypes, so they are rarely compared in containers
+_HASH_SALT = 0x5CADD5A17
+
 
 class ScAddr:
+    __slots__ = ("value",)
+
     def __init__(self, value: int = 0) -> None:
         if not isinstance(value, int):
             raise InvalidTypeError("You should to use int type for ScAddr initialization")
         self.value = value
 
     def __hash__(self) -> int:
-        return hash((self.value, self.__class__))
+        return hash(self.value) ^ _HASH_SALT
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.value})"
@@ -31,3 +39,25 @@ class ScAddr:
 
     def is_valid(self) -> bool:
         return self.__bool__()
+
+
+_set_value = ScAddr.value.__set__
+
+
+def addr_from_value(value: int) -> ScAddr:
+    """Create ScAddr without type checks, for int values received from the sc-server"""
+    addr = _new_object(ScAddr)
+    _set_value(addr, value)
+    return addr
+
+
+def addrs_from_values(values: Iterable[int]) -> list[ScAddr]:
+    """Create ScAddrs without type checks, for int values received from the sc-server"""
+    new_object, set_value = _new_object, _set_value
+    addrs = []
+    append = addrs.append
+    for value in values:
+        addr = new_object(ScAddr)
+        set_value(addr, value)
+        append(addr)
+    return addrs
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable, Iterator, Sequence, overload
+
+from sc_client.constants.exceptions import InvalidTypeError
+from sc_client.models.sc_addr import ScAddr, addr_from_value
+
+_ADDR_TYPECODE = "Q"
+
+
+class ScAddrArray(Sequence):
+    """
+    Compact sequence of ScAddrs stored as unsigned 64-bit integers.
+
+    Items are ScAddrs created on access, slices and set operations return new ScAddrArrays.
+    It can be passed to `erase_elements` and `get_elements_types` as is.
+    """
+
+    __slots__ = ("values",)
+    __hash__ = None
+
+    def __init__(self, addrs: Iterable[ScAddr] = ()) -> None:
+        values = array(_ADDR_TYPECODE)
+        for addr in addrs:
+            if not isinstance(addr, ScAddr):
+                raise InvalidTypeError("You should to use ScAddr type for ScAddrArray initialization")
+            values.append(addr.value)
+        self.values = values
+
+    @classmethod
+    def from_values(cls, values: Iterable[int]) -> ScAddrArray:
+        """Create from int values: a list, an array or a NumPy array"""
+        addr_array = object.__new__(cls)
+        if hasattr(values, "__array_interface__"):
+            values = values.astype("uint64", copy=False).tobytes()
+            addr_array.values = array(_ADDR_TYPECODE)
+            addr_array.values.frombytes(values)
+        else:
+            addr_array.values = array(_ADDR_TYPECODE, values)
+        return addr_array
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @overload
+    def __getitem__(self, index: int) -> ScAddr: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ScAddrArray: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ScAddrArray.from_values(self.values[index])
+        return addr_from_value(self.values[index])
+
+    def __iter__(self) -> Iterator[ScAddr]:
+        return map(addr_from_value, self.values)
+
+    def __contains__(self, addr: Any) -> bool:
+        return isinstance(addr, ScAddr) and addr.value in self.values
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ScAddrArray):
+            return self.values == other.values
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(
+                isinstance(addr, ScAddr) and addr.value == value for addr, value in zip(other, self.values)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.values.tolist()})"
+
+    def __and__(self, other: ScAddrArray) -> ScAddrArray:
+        other_values = set(ScAddrArray._values_of(other))
+        return ScAddrArray.from_values(value for value in dict.fromkeys(self.values) if value in other_values)
+
+    def __or__(self, other: ScAddrArray) -> ScAddrArray:
+        values = dict.fromkeys(self.values)
+        values.update(dict.fromkeys(ScAddrArray._values_of(other)))
+        return ScAddrArray.from_values(values)
+
+    def __sub__(self, other: ScAddrArray) -> ScAddrArray:
+        other_values = set(ScAddrArray._values_of(other))
+        return ScAddrArray.from_values(value for value in dict.fromkeys(self.values) if value not in other_values)
+
+    def __xor__(self, other: ScAddrArray) -> ScAddrArray:
+        return (self - other) | (ScAddrArray.from_values(ScAddrArray._values_of(other)) - self)
+
+    @staticmethod
+    def _values_of(addrs: ScAddrArray | Iterable[ScAddr]) -> Iterable[int]:
+        if isinstance(addrs, ScAddrArray):
+            return addrs.values
+        return ScAddrArray(addrs).values
+
+    def unique(self) -> ScAddrArray:
+        """Addresses without repetitions, in order of their first occurrence"""
+        return ScAddrArray.from_values(dict.fromkeys(self.values))
+
+    def tolist(self) -> list[ScAddr]:
+        return list(self)
+
+    def to_numpy(self):
+        """NumPy array of uint64 values sharing memory with this array, NumPy must be installed"""
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        return numpy.frombuffer(self.values, dtype=numpy.uint64)
+
+    def __array__(self, dtype=None, copy=None):
+        numpy_array = self.to_numpy()
+        if dtype is not None:
+            return numpy_array.astype(dtype)
+        return numpy_array.copy() if copy else numpy_array
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import base64
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, TypedDict, Union
+from typing import IO, Any, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
 
 from sc_client.constants import ScType, common
 from sc_client.constants.exceptions import InvalidTypeError, LinkContentOversizeError
@@ -12,9 +13,56 @@ from sc_client.models.sc_addr import ScAddr
 
 
 class ScConstruction:
+    """
+    Elements to generate, stored by columns: a kind, a type, a source and a target of connectors,
+    a content and its type of links for every element.
+    """
+
     def __init__(self) -> None:
         self.aliases = {}
-        self.commands = []
+        self.elements: List[str] = []
+        self.types: List[ScType] = []
+        self.sources: List[str | ScAddr | None] = []
+        self.targets: List[str | ScAddr | None] = []
+        self.contents: List[ScLinkContentData | None] = []
+        self.content_types: List[int | None] = []
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    @property
+    def commands(self) -> List[ScConstructionCommand]:
+        commands = []
+        for element, sc_type, source, target, content, content_type in zip(
+            self.elements, self.types, self.sources, self.targets, self.contents, self.content_types
+        ):
+            if element == common.Elements.CONNECTOR:
+                data = {common.SOURCE: source, common.TARGET: target}
+            elif element == common.Elements.LINK:
+                data = {common.CONTENT: content, common.TYPE: content_type}
+            else:
+                data = None
+            commands.append(ScConstructionCommand(sc_type, data))
+        return commands
+
+    def _append(
+        self,
+        element: str,
+        sc_type: ScType,
+        alias: str | None,
+        source: str | ScAddr = None,
+        target: str | ScAddr = None,
+        content: ScLinkContentData = None,
+        content_type: int = None,
+    ) -> None:
+        if alias:
+            self.aliases[alias] = len(self.elements)
+        self.elements.append(element)
+        self.types.append(sc_type)
+        self.sources.append(source)
+        self.targets.append(target)
+        self.contents.append(content)
+        self.content_types.append(content_type)
 
     def create_node(self, sc_type: ScType, alias: str = None) -> None:
         warnings.warn(
@@ -26,10 +74,7 @@ class ScConstruction:
     def generate_node(self, sc_type: ScType, alias: str = None) -> None:
         if not sc_type.is_node():
             raise InvalidTypeError("You should pass the node type here")
-        cmd = ScConstructionCommand(sc_type, None)
-        if alias:
-            self.aliases[alias] = len(self.commands)
-        self.commands.append(cmd)
+        self._append(common.Elements.NODE, sc_type, alias)
 
     def create_edge(
         self,
@@ -53,10 +98,7 @@ class ScConstruction:
     ) -> None:
         if not sc_type.is_connector():
             raise InvalidTypeError("You should pass the connector type here")
-        cmd = ScConstructionCommand(sc_type, {common.SOURCE: source, common.TARGET: target})
-        if alias:
-            self.aliases[alias] = len(self.commands)
-        self.commands.append(cmd)
+        self._append(common.Elements.CONNECTOR, sc_type, alias, source, target)
 
     def create_link(self, sc_type: ScType, content: ScLinkContent, alias: str = None) -> None:
         warnings.warn(
@@ -67,14 +109,51 @@ class ScConstruction:
     def generate_link(self, sc_type: ScType, content: ScLinkContent, alias: str = None) -> None:
         if not sc_type.is_link():
             raise InvalidTypeError("You should pass the link type here")
-        cmd = ScConstructionCommand(sc_type, {common.CONTENT: content.data, common.TYPE: content.content_type.value})
-        if alias:
-            self.aliases[alias] = len(self.commands)
-        self.commands.append(cmd)
+        self._append(
+            common.Elements.LINK, sc_type, alias, content=content.encoded_data, content_type=content.content_type.value
+        )
 
     def get_index(self, alias: str) -> int:
         return self.aliases[alias]
 
+    def deduplicated(self, links: bool = False) -> Tuple[ScConstruction, List[int]]:
+        """
+        Construction without repeated connectors of the same type between the same elements and, if `links` is true,
+        without repeated links with the same type and content. Returns it and indices of all elements in it.
+        """
+        unique = ScConstruction()
+        indices = []
+        keys = {}
+        for index, (element, sc_type, source, target, content, content_type) in enumerate(
+            zip(self.elements, self.types, self.sources, self.targets, self.contents, self.content_types)
+        ):
+            key = None
+            if element == common.Elements.CONNECTOR:
+                source_key = self._end_key(source, index, indices)
+                target_key = self._end_key(target, index, indices)
+                if source_key is not None and target_key is not None:
+                    key = (element, sc_type.value, source_key, target_key)
+            elif element == common.Elements.LINK and links:
+                key = (element, sc_type.value, content_type, content)
+            unique_index = keys.get(key) if key is not None else None
+            if unique_index is None:
+                unique_index = len(unique.elements)
+                unique._append(element, sc_type, None, source, target, content, content_type)
+                if key is not None:
+                    keys[key] = unique_index
+            indices.append(unique_index)
+        unique.aliases = {alias: indices[index] for alias, index in self.aliases.items()}
+        return unique, indices
+
+    def _end_key(self, end: str | ScAddr, index: int, indices: List[int]) -> Tuple[str, int] | None:
+        if isinstance(end, ScAddr):
+            return common.Types.ADDR, end.value
+        end_index = self.aliases[end]
+        if end_index >= index:
+            # elements referenced forward are not merged yet, so connectors to them are kept
+            return None
+        return common.Types.REF, indices[end_index]
+
 
 @dataclass
 class ScConstructionCommand:
@@ -91,9 +170,19 @@ class ScLinkContentType(Enum):
     INT = 0
     FLOAT = 1
     STRING = 2
+    BINARY = 3
+
+
+ScLinkContentData = Union[str, int, float, bytes, bytearray, memoryview]
+BINARY_DATA_TYPES = (bytes, bytearray, memoryview)
 
 
-ScLinkContentData = Union[str, int, float]
+def _get_content_size(data: ScLinkContentData) -> int:
+    if isinstance(data, str):
+        return len(data)
+    if isinstance(data, BINARY_DATA_TYPES):
+        return memoryview(data).nbytes
+    return len(str(data))
 
 
 @dataclass
@@ -101,15 +190,69 @@ class ScLinkContent:
     data: ScLinkContentData
     content_type: ScLinkContentType
     addr: ScAddr = None
+    _encoded_data: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        if len(str(self.data)) > LINK_CONTENT_MAX_SIZE:
+        if _get_content_size(self.data) > LINK_CONTENT_MAX_SIZE:
             raise LinkContentOversizeError
         self.content_type = ScLinkContentType(self.content_type)
+        if (self.content_type is ScLinkContentType.BINARY) != isinstance(self.data, BINARY_DATA_TYPES):
+            raise InvalidTypeError("You should use bytes, bytearray or memoryview data for binary content only")
 
     def type_to_str(self) -> str:
         return self.content_type.name.lower()
 
+    @property
+    def encoded_data(self) -> str | int | float:
+        """Data sent to the sc-server, binary data is encoded to base64 once"""
+        if self.content_type is not ScLinkContentType.BINARY:
+            return self.data
+        if self._encoded_data is None:
+            self._encoded_data = base64.b64encode(self.data).decode("ascii")
+        return self._encoded_data
+
+    @classmethod
+    def from_stream(
+        cls,
+        source: IO | Iterable[str | bytes],
+        content_type: ScLinkContentType = ScLinkContentType.BINARY,
+        addr: ScAddr = None,
+    ) -> ScLinkContent:
+        """
+        Content read from a file-like object or an iterator of str or bytes chunks.
+
+        No more than `LINK_CONTENT_MAX_SIZE` is read, so an oversized source is rejected without loading it in full.
+        """
+        if hasattr(source, "read"):
+            return cls(source.read(LINK_CONTENT_MAX_SIZE + 1), content_type, addr)
+        is_binary = ScLinkContentType(content_type) is ScLinkContentType.BINARY
+        chunk_types = BINARY_DATA_TYPES if is_binary else str
+        chunks = []
+        size = 0
+        for chunk in source:
+            if not isinstance(chunk, chunk_types):
+                raise InvalidTypeError("You should use bytes, bytearray or memoryview chunks for binary content only")
+            chunks.append(chunk)
+            size += _get_content_size(chunk)
+            if size > LINK_CONTENT_MAX_SIZE:
+                break
+        return cls((b"" if is_binary else "").join(chunks), content_type, addr)
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[str | bytes | memoryview]:
+        """Data by slices of `chunk_size`, binary data is sliced without copying"""
+        data = memoryview(self.data) if isinstance(self.data, BINARY_DATA_TYPES) else str(self.data)
+        for start in range(0, len(data), chunk_size):
+            yield data[start : start + chunk_size]
+
+    @classmethod
+    def from_encoded(cls, data: str | int | float, content_type: ScLinkContentType) -> ScLinkContent:
+        """Content received from the sc-server, binary data is decoded from base64"""
+        if content_type is ScLinkContentType.BINARY:
+            content = cls(base64.b64decode(data), content_type)
+            content._encoded_data = data
+            return content
+        return cls(data, content_type)
+
 
 class Response(TypedDict):
     id: int
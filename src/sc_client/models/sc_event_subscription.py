@@ -1,4 +1,7 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+from contextvars import Context
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable
 
@@ -20,3 +23,4 @@ class ScEventSubscription:
     id: int = 0
     event_type: ScEventType = None
     callback: ScEventCallbackFunc = None
+    context: Context | None = field(default=None, repr=False, compare=False)
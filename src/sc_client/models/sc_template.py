@@ -1,10 +1,13 @@
+from __future__ import annotations
+
+import json
 import warnings
 from dataclasses import dataclass
 from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-from sc_client.constants import ScType
+from sc_client.constants import ScType, common
 from sc_client.constants.exceptions import InvalidTypeError
-from sc_client.models.sc_addr import ScAddr
+from sc_client.models.sc_addr import ScAddr, addr_from_value, addrs_from_values
 from sc_client.models.sc_event_subscription import ScEventCallbackFunc
 
 ScTemplateValueItem = Union[ScAddr, ScType, str]
@@ -30,6 +33,18 @@ class ScTemplateValue:
             raise InvalidTypeError("You should to use variable types in template")
         self.value = param
 
+    def to_payload(self) -> dict:
+        if isinstance(self.value, ScAddr):
+            result = {common.TYPE: common.Types.ADDR, common.VALUE: self.value.value}
+        elif isinstance(self.value, ScType):
+            result = {common.TYPE: common.Types.TYPE, common.VALUE: self.value.value}
+        else:
+            result = {common.TYPE: common.Types.ALIAS, common.VALUE: self.value}
+
+        if self.alias:
+            result[common.ALIAS] = self.alias
+        return result
+
 
 @dataclass
 class ScTemplateTriple:
@@ -46,6 +61,7 @@ class ScTemplateTriple:
 class ScTemplate:
     def __init__(self) -> None:
         self.triple_list: List[ScTemplateTriple] = []
+        self.prepared_payload: Optional[str] = None
 
     def triple(
         self,
@@ -54,6 +70,22 @@ class ScTemplate:
         target: ScTemplateParam,
     ) -> None:
         self.triple_list.append(ScTemplateTriple(source, connector, target))
+        self.prepared_payload = None
+
+    def to_payload(self) -> List[List[dict]]:
+        return [
+            [triple.source.to_payload(), triple.connector.to_payload(), triple.target.to_payload()]
+            for triple in self.triple_list
+        ]
+
+    def prepare(self) -> ScTemplate:
+        """
+        Encode triples to json once, so requests with this template only encode their params.
+
+        Adding triples resets the prepared payload, changing `triple_list` directly requires calling it again.
+        """
+        self.prepared_payload = json.dumps(self.to_payload())
+        return self
 
     def triple_with_relation(
         self,
@@ -85,28 +117,59 @@ class ScTemplate:
 
 
 class ScTemplateResult:
+    """
+    Addresses of one template search or generation result.
+
+    Addresses received from the sc-server are kept as ints, ScAddrs are created on access.
+    """
+
+    __slots__ = ("_addrs", "_values", "aliases", "addrs_iter")
+
     addrs_iter: Iterator[ScAddr]
 
     def __init__(self, addrs: List[ScAddr], aliases: Dict[str, int]) -> None:
-        self.addrs = addrs
+        self._addrs: Optional[List[ScAddr]] = addrs
+        self._values: Optional[List[int]] = None
         self.aliases = aliases
 
+    @classmethod
+    def from_values(cls, values: List[int], aliases: Dict[str, int]) -> ScTemplateResult:
+        result = cls.__new__(cls)
+        result._addrs = None
+        result._values = values
+        result.aliases = aliases
+        return result
+
+    @property
+    def addrs(self) -> List[ScAddr]:
+        if self._addrs is None:
+            self._addrs = addrs_from_values(self._values)
+            self._values = None
+        return self._addrs
+
+    @addrs.setter
+    def addrs(self, addrs: List[ScAddr]) -> None:
+        self._addrs = addrs
+        self._values = None
+
     def __len__(self) -> int:
-        return len(self.addrs)
+        return len(self._values) if self._addrs is None else len(self._addrs)
 
     def get(self, alias_or_index: Union[str, int]) -> ScAddr:
         """Get ScAddr by alias or index in template result"""
         if isinstance(alias_or_index, str):
-            return self.addrs[self.aliases[alias_or_index]]
-        return self.addrs[alias_or_index]
+            return self[self.aliases[alias_or_index]]
+        return self[alias_or_index]
 
     def __getitem__(self, index: int) -> ScAddr:
         """Get ScAddr by index in template result"""
-        return self.addrs[index]
+        if self._addrs is None:
+            return addr_from_value(self._values[index])
+        return self._addrs[index]
 
     def __iter__(self):
         """Iterate by triples"""
-        self.addrs_iter = iter(self.addrs)
+        self.addrs_iter = iter(self._addrs) if self._addrs is not None else map(addr_from_value, self._values)
         return self
 
     def __next__(self) -> Tuple[ScAddr, ScAddr, ScAddr]:
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Sequence, Union, overload
+
+from sc_client.models.sc_addr_array import ScAddrArray
+from sc_client.models.sc_template import ScTemplateResult
+
+_ADDR_TYPECODE = "Q"
+
+
+class ScTemplateResultSet(Sequence):
+    """
+    Template search results stored by columns: one array of address values per template position.
+
+    Items are ScTemplateResults created on access, so the set can be used instead of a list of results.
+    """
+
+    __slots__ = ("columns", "aliases", "_size")
+    __hash__ = None
+
+    def __init__(self, columns: List[array], aliases: Dict[str, int], size: int = None) -> None:
+        self.columns = columns
+        self.aliases = aliases
+        self._size = len(columns[0]) if columns else size or 0
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[int]], aliases: Dict[str, int]) -> ScTemplateResultSet:
+        """Create from rows of address values, e.g. `addrs` of the search_by_template response payload"""
+        return cls.from_row_chunks((rows,), aliases)
+
+    @classmethod
+    def from_row_chunks(cls, chunks: Iterable[Sequence[Sequence[int]]], aliases: Dict[str, int]) -> ScTemplateResultSet:
+        """Create from chunks of rows of address values, columns are extended by every chunk"""
+        columns = []
+        size = 0
+        for rows in chunks:
+            if columns:
+                for column, values in zip(columns, zip(*rows)):
+                    column.extend(values)
+            else:
+                columns = [array(_ADDR_TYPECODE, column) for column in zip(*rows)]
+            size += len(rows)
+        return cls(columns, aliases, size)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> ScTemplateResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ScTemplateResultSet: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ScTemplateResultSet([column[index] for column in self.columns], self.aliases)
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ScTemplateResultSet index out of range")
+        return ScTemplateResult.from_values([column[index] for column in self.columns], self.aliases)
+
+    def __iter__(self) -> Iterator[ScTemplateResult]:
+        aliases = self.aliases
+        from_values = ScTemplateResult.from_values
+        return (from_values(list(row), aliases) for row in zip(*self.columns))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={self._size}, aliases={self.aliases})"
+
+    def _column_index(self, alias_or_index: Union[str, int]) -> int:
+        if isinstance(alias_or_index, str):
+            return self.aliases[alias_or_index]
+        return alias_or_index
+
+    def column(self, alias_or_index: Union[str, int]) -> ScAddrArray:
+        """Addresses of all results by alias or index in template"""
+        index = self._column_index(alias_or_index)
+        if not self.columns:
+            return ScAddrArray()
+        return ScAddrArray.from_values(self.columns[index])
+
+    def unique(self, alias_or_index: Union[str, int]) -> ScAddrArray:
+        """Addresses by alias or index without repetitions, in order of their first occurrence"""
+        index = self._column_index(alias_or_index)
+        if not self.columns:
+            return ScAddrArray()
+        return ScAddrArray.from_values(dict.fromkeys(self.columns[index]))
+
+    def to_numpy(self):
+        """NumPy array of uint64 values with a row per result, NumPy must be installed"""
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        if not self.columns:
+            return numpy.empty((self._size, 0), dtype=numpy.uint64)
+        return numpy.column_stack([numpy.frombuffer(column, dtype=numpy.uint64) for column in self.columns])
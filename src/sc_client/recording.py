@@ -0,0 +1,219 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import IO, Deque, Dict, Iterator, List, Tuple
+
+import websocket
+
+from sc_client.constants import common
+
+OUTGOING = "out"
+INCOMING = "in"
+
+DEFAULT_BUFFER_SIZE = 65536
+DEFAULT_FLUSH_INTERVAL = 0.1
+DEFAULT_REPLAY_TIMEOUT = 10.0
+
+
+class TrafficRecorder:
+    """
+    Records sc-server frames into a JSON lines file, one `{"t": timestamp, "dir": "out" | "in", "frame": {...}}` per line.
+
+    Frames are put into a ring buffer and written by a background thread, so recording only appends to a deque.
+    If the writer falls behind for more than `buffer_size` frames, the oldest ones are dropped and counted in `dropped`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        self.path = path
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._buffer: Deque[Tuple[float, str, str]] = deque(maxlen=buffer_size)
+        self._wakeup = threading.Event()
+        self._is_closed = False
+        self._file: IO[str] = open(path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+        self._writer = threading.Thread(target=self._write_loop, name="sc-client-recorder", daemon=True)
+        self._writer.start()
+
+    def record(self, direction: str, frame: str) -> None:
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append((time.time(), direction, frame))
+
+    def _write_buffered(self) -> None:
+        lines = []
+        while self._buffer:
+            timestamp, direction, frame = self._buffer.popleft()
+            # frames are json already, so they are written as they are, without escaping
+            lines.append(f'{{"t": {timestamp!r}, "dir": "{direction}", "frame": {frame}}}\n')
+        if lines:
+            self._file.writelines(lines)
+            self._file.flush()
+
+    def _write_loop(self) -> None:
+        while not self._is_closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._write_buffered()
+
+    def flush(self) -> None:
+        self._wakeup.set()
+        while self._buffer and self._writer.is_alive():
+            time.sleep(self.flush_interval / 10)
+
+    def close(self) -> None:
+        if self._is_closed:
+            return
+        self._is_closed = True
+        self._wakeup.set()
+        self._writer.join()
+        self._write_buffered()
+        self._file.close()
+
+    def __enter__(self) -> TrafficRecorder:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+@dataclass
+class RecordedFrame:
+    timestamp: float
+    direction: str
+    frame: dict
+
+
+def read_recording(path: str) -> Iterator[RecordedFrame]:
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                yield RecordedFrame(record["t"], record["dir"], record["frame"])
+
+
+@dataclass
+class ReplayReport:
+    duration: float = 0.0
+    sent: int = 0
+    received: int = 0
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+
+    @property
+    def lost(self) -> int:
+        return self.sent - self.received
+
+    def to_dict(self) -> dict:
+        requests = {}
+        for request_type, latencies in self.latencies.items():
+            latencies = sorted(latencies)
+            requests[request_type] = {
+                "count": len(latencies),
+                "mean_ms": sum(latencies) / len(latencies) * 1000,
+                "p99_ms": latencies[max(math.ceil(0.99 * len(latencies)), 1) - 1] * 1000,
+            }
+        return {
+            "duration": self.duration,
+            "sent": self.sent,
+            "received": self.received,
+            "lost": self.lost,
+            "requests": requests,
+        }
+
+
+class TrafficReplayer:
+    """Sends recorded outgoing frames to the sc-server with their original intervals divided by `speed`"""
+
+    def __init__(self, frames: List[RecordedFrame]) -> None:
+        self.frames = [frame for frame in frames if frame.direction == OUTGOING]
+
+    @classmethod
+    def from_file(cls, path: str) -> TrafficReplayer:
+        return cls(list(read_recording(path)))
+
+    def replay(self, url: str, speed: float = 1.0, timeout: float = DEFAULT_REPLAY_TIMEOUT) -> ReplayReport:
+        """Replay frames; speed `math.inf` sends them without pauses. Returns latencies by request type"""
+        if speed <= 0:
+            raise ValueError("Speed must be positive")
+        report = ReplayReport()
+        pending: Dict[int, Tuple[str, float]] = {}
+        lock = threading.Lock()
+        is_all_sent = threading.Event()
+        is_all_received = threading.Event()
+        connection = websocket.create_connection(url)
+
+        def receive() -> None:
+            while True:
+                try:
+                    response = json.loads(connection.recv())
+                except (websocket.WebSocketException, OSError, ValueError):
+                    return
+                if response.get(common.EVENT):
+                    continue
+                received_time = time.perf_counter()
+                with lock:
+                    request = pending.pop(response.get(common.ID), None)
+                    if request is not None:
+                        request_type, sent_time = request
+                        report.latencies.setdefault(request_type, []).append(received_time - sent_time)
+                        report.received += 1
+                    if is_all_sent.is_set() and not pending:
+                        is_all_received.set()
+                        return
+
+        receiver = threading.Thread(target=receive, name="sc-client-replayer", daemon=True)
+        receiver.start()
+        start = time.perf_counter()
+        try:
+            first_timestamp = self.frames[0].timestamp if self.frames else 0.0
+            for frame in self.frames:
+                delay = (frame.timestamp - first_timestamp) / speed - (time.perf_counter() - start)
+                if delay > 0:
+                    time.sleep(delay)
+                with lock:
+                    pending[frame.frame.get(common.ID)] = (frame.frame.get(common.TYPE), time.perf_counter())
+                    report.sent += 1
+                connection.send(json.dumps(frame.frame))
+            with lock:
+                is_all_sent.set()
+                if not pending:
+                    is_all_received.set()
+            is_all_received.wait(timeout)
+        finally:
+            report.duration = time.perf_counter() - start
+            connection.close()
+            receiver.join(timeout)
+        return report
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="sc-client-replay", description="Replay recorded sc-client traffic")
+    parser.add_argument("recording", help="path to the recording made by TrafficRecorder")
+    parser.add_argument("url", help="sc-server url, e.g. ws://localhost:8090/ws_json")
+    parser.add_argument("--speed", type=float, default=1.0, help="speed-up of the recorded intervals, inf - no pauses")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_REPLAY_TIMEOUT, help="time to wait for responses")
+    args = parser.parse_args(argv)
+    report = TrafficReplayer.from_file(args.recording).replay(args.url, args.speed, args.timeout)
+    print(json.dumps(report.to_dict(), indent=2))
+    return 0 if not report.lost else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
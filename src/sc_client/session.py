@@ -6,19 +6,27 @@ Distributed under the MIT License
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import json
 import logging
 import threading
 import time
-from typing import Any, Callable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Collection, Deque, Iterable
 
 import websocket
 
+from sc_client import recording, tracing
+from sc_client._internal_utils import EncodedJson, decode_incrementally
 from sc_client.client._executor import Executor
 from sc_client.constants import common
 from sc_client.constants.common import ClientCommand
 from sc_client.constants.exceptions import PayloadMaxSizeError
 from sc_client.constants.numeric import (
+    DECODER_POOL_SIZE,
+    INCREMENTAL_DECODING_MIN_SIZE,
     LOGGING_MAX_SIZE,
     MAX_PAYLOAD_SIZE,
     SERVER_ANSWER_CHECK_TIME,
@@ -26,7 +34,8 @@ from sc_client.constants.numeric import (
     SERVER_RECONNECT_RETRIES,
     SERVER_RECONNECT_RETRY_DELAY,
 )
-from sc_client.models import Response, ScAddr, ScEventSubscription
+from sc_client.models import Response, ScConstruction, ScEventSubscription
+from sc_client.models.sc_addr import addrs_from_values
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +51,9 @@ def default_error_handler(error: Exception) -> None:
 class _ScClientSession:
     is_open = False
     lock_instance = threading.Lock()
+    responses_condition = threading.Condition()
     responses_dict = {}
+    discarded_responses = set()
     event_subscriptions_dict = {}
     command_id = 0
     executor = Executor()
@@ -53,11 +64,21 @@ class _ScClientSession:
     reconnect_retries: int = SERVER_RECONNECT_RETRIES
     reconnect_retry_delay: float = SERVER_RECONNECT_RETRY_DELAY
     last_healthcheck_answer: str = None
+    recorder: recording.TrafficRecorder | None = None
+    decoder_pool = ThreadPoolExecutor(DECODER_POOL_SIZE, thread_name_prefix="sc-client-decoder")
+    decoding_messages = 0
+    outgoing_lock = threading.Lock()
+    outgoing_messages: Deque[str] = deque()
+    queued_messages = 0
+    written_messages = 0
+    writer_lock = threading.Lock()
+    is_coalescing_enabled = False
 
     @classmethod
     def clear(cls):
         cls.is_open = False
         cls.responses_dict = {}
+        cls.discarded_responses = set()
         cls.event_subscriptions_dict = {}
         cls.command_id = 0
         cls.ws_app = None
@@ -66,24 +87,88 @@ class _ScClientSession:
         cls.post_reconnect_callback = lambda *args: None
         cls.reconnect_retries = SERVER_RECONNECT_RETRIES
         cls.reconnect_retry_delay = SERVER_RECONNECT_RETRY_DELAY
+        cls.recorder = None
+        cls.decoding_messages = 0
+        cls.outgoing_messages = deque()
+        cls.queued_messages = 0
+        cls.written_messages = 0
+        cls.is_coalescing_enabled = False
+
+
+def decode_response(message: str | bytes) -> Response:
+    """
+    Decode a message of the sc-server.
+
+    Only the envelope is looked at by the session, the payload is left as plain lists and dicts built by the C decoder
+    for command processors, without Python calls per object.
+    Rows of addresses in large messages are left undecoded and decoded by chunks by processors.
+    """
+    if isinstance(message, str) and len(message) >= INCREMENTAL_DECODING_MIN_SIZE:
+        return decode_incrementally(message)
+    return json.loads(message)
 
 
 def _on_message(_, response: str) -> None:
     logger.debug(f"Receive: {str(response)[:LOGGING_MAX_SIZE]}")
-    response = json.loads(response, object_hook=Response)
+    if _ScClientSession.recorder is not None:
+        _ScClientSession.recorder.record(recording.INCOMING, response)
+    if len(response) < INCREMENTAL_DECODING_MIN_SIZE:
+        _process_message(decode_response(response))
+        return
+    # large messages are decoded by the pool, so the reader thread keeps receiving other responses and events;
+    # they are decoded incrementally, so decoding doesn't hold the GIL for long
+    with _ScClientSession.responses_condition:
+        _ScClientSession.decoding_messages += 1
+    _ScClientSession.decoder_pool.submit(_process_offloaded_message, response)
+
+
+def _process_offloaded_message(message: str) -> None:
+    try:
+        _process_message(decode_incrementally(message))
+    except Exception as error:  # pylint: disable=broad-except
+        # like a failure in the websocket thread, it closes the connection, so callers waiting for responses fail
+        logger.exception("Failed to process a message of the sc-server")
+        close_connection()
+        with contextlib.suppress(Exception):
+            _on_error(_ScClientSession.ws_app, error)
+    finally:
+        with _ScClientSession.responses_condition:
+            _ScClientSession.decoding_messages -= 1
+            _ScClientSession.responses_condition.notify_all()
+
+
+def _process_message(response: Response) -> None:
     if response.get(common.EVENT):
         threading.Thread(
             target=_emit_callback,
             args=(response.get(common.ID), response.get(common.PAYLOAD)),
         ).start()
     else:
-        _ScClientSession.responses_dict[response.get(common.ID)] = response
+        with _ScClientSession.responses_condition:
+            command_id = response.get(common.ID)
+            if command_id in _ScClientSession.discarded_responses:
+                _ScClientSession.discarded_responses.discard(command_id)
+            else:
+                _ScClientSession.responses_dict[command_id] = response
+                _ScClientSession.responses_condition.notify_all()
 
 
 def _emit_callback(event_id: int, elems: list[int]) -> None:
     event = _ScClientSession.event_subscriptions_dict.get(event_id)
     if event:
-        event.callback(*[ScAddr(addr) for addr in elems])
+        if event.context is None:
+            _run_callback(event, elems)
+        else:
+            event.context.copy().run(_run_callback, event, elems)
+
+
+def _run_callback(event: ScEventSubscription, elems: list[int]) -> None:
+    attributes = {
+        tracing.EVENT_SUBSCRIPTION_ID_ATTRIBUTE: event.id,
+        tracing.EVENT_TYPE_ATTRIBUTE: event.event_type.value if event.event_type else None,
+    }
+    with tracing.start_span(tracing.EVENT_CALLBACK_SPAN_NAME, attributes):
+        event.callback(*addrs_from_values(elems))
 
 
 def _on_open(_) -> None:
@@ -104,6 +189,14 @@ def set_error_handler(callback) -> None:
     _ScClientSession.error_handler = callback
 
 
+def set_recorder(recorder: recording.TrafficRecorder | None) -> None:
+    _ScClientSession.recorder = recorder
+
+
+def set_coalescing(is_enabled: bool) -> None:
+    _ScClientSession.is_coalescing_enabled = is_enabled
+
+
 def set_reconnect_handler(
     reconnect_callback, post_reconnect_callback, reconnect_retries: int, reconnect_retry_delay: float
 ) -> None:
@@ -153,17 +246,67 @@ def close_connection() -> None:
 
 
 def receive_message(command_id: int) -> Response:
-    response = None
-    while not response and _ScClientSession.is_open:
-        response = _ScClientSession.responses_dict.get(command_id)
-        time.sleep(SERVER_ANSWER_CHECK_TIME)
-    return response
+    return receive_any_message([command_id])[1]
 
 
-def _send_message(data: str, retries: int, retry: int = 0) -> None:
-    try:
+def receive_any_message(command_ids: Collection[int]) -> tuple[int | None, Response | None]:
+    """Wait for a response to one of the commands and take it"""
+    condition = _ScClientSession.responses_condition
+    responses = _ScClientSession.responses_dict
+    with condition:
+        while True:
+            for command_id in command_ids:
+                response = responses.pop(command_id, None)
+                if response is not None:
+                    return command_id, response
+            # responses received before closing of the connection may still be decoded
+            if not _ScClientSession.is_open and not _ScClientSession.decoding_messages:
+                break
+            condition.wait(SERVER_ANSWER_CHECK_TIME)
+    _on_error(_ScClientSession.ws_app, ConnectionAbortedError("Sc-server takes a long time to respond"))
+    return None, None
+
+
+def discard_messages(command_ids: Iterable[int]) -> None:
+    """Drop responses to the commands, including ones that have not been received yet"""
+    with _ScClientSession.responses_condition:
+        for command_id in command_ids:
+            if _ScClientSession.responses_dict.pop(command_id, None) is None:
+                _ScClientSession.discarded_responses.add(command_id)
+
+
+class _CoalescedFrames:
+    """Frames sent by `WebSocket.send_frame` as one socket write"""
+
+    def __init__(self, messages: list[str]) -> None:
+        self.frames = [websocket.ABNF.create_frame(data, websocket.ABNF.OPCODE_TEXT) for data in messages]
+        self.get_mask_key = None
+
+    def format(self) -> bytes:
+        for frame in self.frames:
+            frame.get_mask_key = self.get_mask_key or frame.get_mask_key
+        return b"".join(frame.format() for frame in self.frames)
+
+    def __str__(self) -> str:
+        return "\n".join(str(frame) for frame in self.frames)
+
+
+def _write_messages(messages: list[str]) -> None:
+    for data in messages:
         logger.debug(f"Send: {data[:LOGGING_MAX_SIZE]}")
-        _ScClientSession.ws_app.send(data)
+    ws_app = _ScClientSession.ws_app
+    if len(messages) == 1 or not _ScClientSession.is_coalescing_enabled:
+        for data in messages:
+            ws_app.send(data)
+        return
+    if ws_app.sock is None or not ws_app.sock.connected:
+        raise websocket.WebSocketConnectionClosedException("Connection is already closed.")
+    ws_app.sock.send_frame(_CoalescedFrames(messages))
+
+
+def _send_message(messages: list[str], retries: int, retry: int = 0) -> None:
+    try:
+        _write_messages(messages)
     except websocket.WebSocketConnectionClosedException:
         if _ScClientSession.reconnect_callback and retry < retries:
             logger.warning(
@@ -173,38 +316,70 @@ def _send_message(data: str, retries: int, retry: int = 0) -> None:
             if retry > 0:
                 time.sleep(_ScClientSession.reconnect_retry_delay)
             _ScClientSession.reconnect_callback()
-            _send_message(data, retries, retry + 1)
+            _send_message(messages, retries, retry + 1)
         else:
             _on_error(_ScClientSession.ws_app, ConnectionAbortedError("Sc-server takes a long time to respond"))
 
 
+def _queue_message(data: str) -> None:
+    """
+    Queue a message and send it with the messages queued by other threads.
+
+    The thread taking the writer lock sends all queued messages at once, so sends are never interleaved,
+    a message is sent immediately if no one is writing, and messages queued during a write are sent by one next write.
+    """
+    session = _ScClientSession
+    with session.outgoing_lock:
+        session.outgoing_messages.append(data)
+        session.queued_messages += 1
+        position = session.queued_messages
+    with session.writer_lock:
+        if session.written_messages >= position:
+            return
+        with session.outgoing_lock:
+            messages = list(session.outgoing_messages)
+            session.outgoing_messages.clear()
+            session.written_messages = session.queued_messages
+        _send_message(messages, session.reconnect_retries)
+
+
 def send_message(request_type: common.ClientCommand, payload: Any) -> Response:
+    command_id = post_message(request_type, payload)
+    return receive_message(command_id)
+
+
+def post_message(request_type: common.ClientCommand, payload: Any) -> int:
+    """Send a command without waiting for its response, returns the command id to receive it"""
     with _ScClientSession.lock_instance:
         _ScClientSession.command_id += 1
         command_id = _ScClientSession.command_id
-    data = json.dumps(
-        {
-            common.ID: command_id,
-            common.TYPE: request_type.value,
-            common.PAYLOAD: payload,
-        }
-    )
+    if isinstance(payload, EncodedJson):
+        data = (
+            f'{{"{common.ID}": {command_id}, "{common.TYPE}": "{request_type.value}", "{common.PAYLOAD}": {payload}}}'
+        )
+    else:
+        data = json.dumps(
+            {
+                common.ID: command_id,
+                common.TYPE: request_type.value,
+                common.PAYLOAD: payload,
+            }
+        )
+
+    if _ScClientSession.recorder is not None:
+        _ScClientSession.recorder.record(recording.OUTGOING, data)
 
     len_data = len(bytes(data, "utf-8"))
+    tracing.get_current_span().set_attributes(
+        {tracing.COMMAND_ID_ATTRIBUTE: command_id, tracing.PAYLOAD_SIZE_ATTRIBUTE: len_data}
+    )
     if len_data > MAX_PAYLOAD_SIZE:
         _on_error(
             _ScClientSession.ws_app, PayloadMaxSizeError(f"Data is too large: {len_data} > {MAX_PAYLOAD_SIZE} bytes")
         )
 
-    def _handle_message() -> Response:
-        _send_message(data, _ScClientSession.reconnect_retries)
-        return receive_message(command_id)
-
-    response = _handle_message()
-    if not response:
-        _on_error(_ScClientSession.ws_app, ConnectionAbortedError("Sc-server takes a long time to respond"))
-
-    return response
+    _queue_message(data)
+    return command_id
 
 
 def get_event_subscription(event_subscription_id: int) -> ScEventSubscription | None:
@@ -216,8 +391,19 @@ def drop_event_subscription(event_subscription_id: int):
 
 
 def set_event_subscription(event_subscription: ScEventSubscription) -> None:
+    if tracing.is_enabled():
+        # callbacks are run in the context of the subscription, so they continue its trace
+        event_subscription.context = contextvars.copy_context()
     _ScClientSession.event_subscriptions_dict[event_subscription.id] = event_subscription
 
 
-def execute(request_type: ClientCommand, *args):
-    return _ScClientSession.executor.run(request_type, *args)
+def execute(request_type: ClientCommand, *args, **options):
+    return _ScClientSession.executor.run(request_type, *args, **options)
+
+
+def execute_many(request_type: ClientCommand, args_list: Iterable[tuple], window: int, ordered: bool = True, **options):
+    return _ScClientSession.executor.run_many(request_type, args_list, window, ordered, **options)
+
+
+def execute_by_chunks(constr: ScConstruction, chunk_size: int, window: int, **options):
+    return _ScClientSession.executor.run_by_chunks(constr, chunk_size, window, **options)
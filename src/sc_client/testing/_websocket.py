@@ -0,0 +1,206 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import logging
+import socket
+import struct
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+_HANDSHAKE_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_HANDSHAKE_RESPONSE = (
+    "HTTP/1.1 101 Switching Protocols\r\n"
+    "Upgrade: websocket\r\n"
+    "Connection: Upgrade\r\n"
+    "Sec-WebSocket-Accept: {accept}\r\n\r\n"
+)
+
+OPCODE_CONTINUATION = 0x0
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+
+def _unmask(data: bytes, mask: bytes) -> bytes:
+    length = len(data)
+    if not length:
+        return data
+    key = (mask * (length // 4 + 1))[:length]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(key, "big")).to_bytes(length, "big")
+
+
+def _format_frame(opcode: int, data: bytes) -> bytes:
+    length = len(data)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + data
+
+
+class WebSocketConnection:
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.reader = sock.makefile("rb")
+        self.send_lock = threading.Lock()
+        self.is_open = True
+
+    def handshake(self) -> bool:
+        headers = {}
+        line = self.reader.readline()
+        if not line.startswith(b"GET"):
+            return False
+        while True:
+            line = self.reader.readline()
+            if not line or line in (b"\r\n", b"\n"):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        key = headers.get("sec-websocket-key")
+        if key is None:
+            return False
+        accept = base64.b64encode(hashlib.sha1((key + _HANDSHAKE_GUID).encode()).digest()).decode()
+        self.sock.sendall(_HANDSHAKE_RESPONSE.format(accept=accept).encode())
+        return True
+
+    def _read_exactly(self, size: int) -> bytes:
+        data = self.reader.read(size)
+        if len(data) != size:
+            raise ConnectionError("Connection closed while reading a frame")
+        return data
+
+    def read_frame(self) -> tuple[bool, int, bytes]:
+        first, second = self._read_exactly(2)
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", self._read_exactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", self._read_exactly(8))
+        mask = self._read_exactly(4) if second & 0x80 else None
+        data = self._read_exactly(length)
+        if mask is not None:
+            data = _unmask(data, mask)
+        return bool(first & 0x80), first & 0x0F, data
+
+    def read_message(self) -> str | None:
+        fragments = []
+        message_opcode = None
+        while True:
+            is_final, opcode, data = self.read_frame()
+            if opcode == OPCODE_PING:
+                self.send(OPCODE_PONG, data)
+                continue
+            if opcode == OPCODE_PONG:
+                continue
+            if opcode == OPCODE_CLOSE:
+                self.send(OPCODE_CLOSE, data[:2])
+                return None
+            if opcode != OPCODE_CONTINUATION:
+                message_opcode = opcode
+            fragments.append(data)
+            if is_final:
+                message = b"".join(fragments)
+                return message.decode("utf-8") if message_opcode == OPCODE_TEXT else message.decode("latin-1")
+
+    def send(self, opcode: int, data: bytes) -> None:
+        frame = _format_frame(opcode, data)
+        with self.send_lock:
+            if self.is_open:
+                self.sock.sendall(frame)
+
+    def send_text(self, text: str) -> None:
+        try:
+            self.send(OPCODE_TEXT, text.encode("utf-8"))
+        except OSError:
+            self.close()
+
+    def close(self) -> None:
+        with self.send_lock:
+            if not self.is_open:
+                return
+            self.is_open = False
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+class WebSocketServer:
+    def __init__(
+        self,
+        on_message: Callable[[WebSocketConnection, str], None],
+        on_close: Callable[[WebSocketConnection], None] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.on_message = on_message
+        self.on_close = on_close
+        self.host = host
+        self.port = port
+        self.connections: set[WebSocketConnection] = set()
+        self._server_socket: socket.socket | None = None
+        self._accept_thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._server_socket = socket.create_server((self.host, self.port))
+        self.port = self._server_socket.getsockname()[1]
+        self._accept_thread = threading.Thread(target=self._accept, name="sc-server-emulator-accept", daemon=True)
+        self._accept_thread.start()
+
+    def stop(self) -> None:
+        if self._server_socket is not None:
+            # closing alone does not wake up the thread blocked in `accept`
+            try:
+                self._server_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._server_socket.close()
+            self._server_socket = None
+        for connection in list(self.connections):
+            connection.close()
+        if self._accept_thread is not None:
+            self._accept_thread.join()
+            self._accept_thread = None
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _ = self._server_socket.accept()
+            except (OSError, AttributeError):
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(
+                target=self._serve, args=(WebSocketConnection(sock),), name="sc-server-emulator-connection", daemon=True
+            ).start()
+
+    def _serve(self, connection: WebSocketConnection) -> None:
+        self.connections.add(connection)
+        try:
+            if not connection.handshake():
+                return
+            while True:
+                message = connection.read_message()
+                if message is None:
+                    return
+                self.on_message(connection, message)
+        except (OSError, ConnectionError, ValueError) as e:
+            logger.debug(f"Emulator connection is closed: {e}")
+        finally:
+            self.connections.discard(connection)
+            connection.close()
+            if self.on_close is not None:
+                self.on_close(connection)
@@ -0,0 +1,254 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from sc_client import client
+from sc_client.constants import sc_type
+from sc_client.models import ScAddr, ScConstruction, ScLinkContent, ScLinkContentType, ScTemplate
+from sc_client.testing.sc_server import ScServerEmulator
+
+DEFAULT_MIX = "search_by_template=5,generate_elements=3,get_link_content=2"
+PERCENTILES = (50, 90, 99)
+
+
+def parse_mix(mix: str) -> Dict[str, int]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in Workload.operation_names:
+            raise ValueError(f"Unknown operation `{name}`, expected one of: {', '.join(Workload.operation_names)}")
+        weights[name] = int(weight) if weight else 1
+        if weights[name] < 0:
+            raise ValueError(f"Weight of `{name}` must be non-negative")
+    if not any(weights.values()):
+        raise ValueError("Workload mix must have at least one positive weight")
+    return weights
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class Workload:
+    """Requests issued by the load generator, prepared on a small graph of one node with linked sc-links"""
+
+    operation_names = ("search_by_template", "generate_elements", "get_link_content")
+
+    def __init__(self, links_count: int = 10, elements_count: int = 10) -> None:
+        self.links_count = links_count
+        self.elements_count = elements_count
+        self.node: Optional[ScAddr] = None
+        self.links: List[ScAddr] = []
+
+    def prepare(self) -> None:
+        const = ScConstruction()
+        const.generate_node(sc_type.CONST_NODE, "node")
+        for i in range(self.links_count):
+            content = ScLinkContent(f"load content {i}", ScLinkContentType.STRING)
+            const.generate_link(sc_type.CONST_NODE_LINK, content, f"link_{i}")
+            const.generate_connector(sc_type.CONST_PERM_POS_ARC, "node", f"link_{i}")
+        addrs = client.generate_elements(const)
+        self.node = addrs[0]
+        self.links = addrs[1::2]
+
+    def operations(self) -> Dict[str, Callable[[], object]]:
+        return {
+            "search_by_template": self.search_by_template,
+            "generate_elements": self.generate_elements,
+            "get_link_content": self.get_link_content,
+        }
+
+    def search_by_template(self) -> object:
+        templ = ScTemplate()
+        templ.triple(self.node, sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE_LINK >> "_link")
+        return client.search_by_template(templ)
+
+    def generate_elements(self) -> object:
+        const = ScConstruction()
+        for _ in range(self.elements_count):
+            const.generate_node(sc_type.CONST_NODE)
+        return client.generate_elements(const)
+
+    def get_link_content(self) -> object:
+        return client.get_link_content(*self.links)
+
+
+@dataclass
+class OperationStats:
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies) + self.errors
+
+    def to_dict(self, duration: float) -> dict:
+        latencies = sorted(self.latencies)
+        result = {
+            "requests": self.count,
+            "errors": self.errors,
+            "error_rate": self.errors / self.count if self.count else 0.0,
+            "throughput": self.count / duration if duration else 0.0,
+        }
+        for percent in PERCENTILES:
+            result[f"p{percent}_ms"] = percentile(latencies, percent) * 1000
+        result["max_ms"] = latencies[-1] * 1000 if latencies else 0.0
+        return result
+
+
+@dataclass
+class LoadReport:
+    duration: float
+    threads: int
+    operations: Dict[str, OperationStats]
+
+    def total(self) -> OperationStats:
+        total = OperationStats()
+        for stats in self.operations.values():
+            total.latencies.extend(stats.latencies)
+            total.errors += stats.errors
+        return total
+
+    def to_dict(self) -> dict:
+        return {
+            "duration": self.duration,
+            "threads": self.threads,
+            "total": self.total().to_dict(self.duration),
+            "operations": {name: stats.to_dict(self.duration) for name, stats in self.operations.items()},
+        }
+
+    def format(self) -> str:
+        columns = ["requests", "throughput", "error_rate"] + [f"p{p}_ms" for p in PERCENTILES] + ["max_ms"]
+        rows = [(name, stats.to_dict(self.duration)) for name, stats in self.operations.items()]
+        rows.append(("total", self.total().to_dict(self.duration)))
+        lines = [
+            f"{self.threads} threads, {self.duration:.2f} s",
+            f"{'operation':<20}" + "".join(f"{c:>12}" for c in columns),
+        ]
+        for name, values in rows:
+            lines.append(f"{name:<20}" + "".join(f"{values[c]:>12.2f}" for c in columns))
+        return "\n".join(lines)
+
+
+def run_load(
+    mix: Dict[str, int],
+    threads: int = 1,
+    duration: float = None,
+    requests: int = None,
+    workload: Workload = None,
+    seed: int = None,
+) -> LoadReport:
+    """Issue requests of the mix from several threads until the duration has passed or the requests have been sent"""
+    if duration is None and requests is None:
+        raise ValueError("Duration or number of requests must be set")
+    workload = workload or Workload()
+    workload.prepare()
+    operations = workload.operations()
+    names = [name for name, weight in mix.items() if weight]
+    weights = [mix[name] for name in names]
+    stats = {name: OperationStats() for name in names}
+    stats_lock = threading.Lock()
+    counter_lock = threading.Lock()
+    remaining = [requests]
+
+    def take_request() -> bool:
+        if requests is None:
+            return True
+        with counter_lock:
+            if remaining[0] <= 0:
+                return False
+            remaining[0] -= 1
+            return True
+
+    def worker(index: int, deadline: Optional[float]) -> None:
+        rand = random.Random(None if seed is None else seed + index)
+        local_stats = {name: OperationStats() for name in names}
+        while (deadline is None or time.perf_counter() < deadline) and take_request():
+            name = rand.choices(names, weights)[0]
+            start = time.perf_counter()
+            try:
+                operations[name]()
+            except Exception:  # pylint: disable=broad-except
+                local_stats[name].errors += 1
+            else:
+                local_stats[name].latencies.append(time.perf_counter() - start)
+        with stats_lock:
+            for name, local in local_stats.items():
+                stats[name].latencies.extend(local.latencies)
+                stats[name].errors += local.errors
+
+    start = time.perf_counter()
+    deadline = start + duration if duration is not None else None
+    workers = [threading.Thread(target=worker, args=(i, deadline), name=f"sc-client-load-{i}") for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return LoadReport(time.perf_counter() - start, threads, stats)
+
+
+def _parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="sc-client-load", description="Measure throughput and latency of sc-client requests"
+    )
+    parser.add_argument("url", nargs="?", help="sc-server url, e.g. ws://localhost:8090/ws_json")
+    parser.add_argument("--emulator", action="store_true", help="run against a local sc-server emulator")
+    parser.add_argument("--latency", type=float, default=0.0, help="emulator latency of every request in seconds")
+    parser.add_argument("--threads", type=int, default=4, help="number of threads sending requests")
+    parser.add_argument("--duration", type=float, default=None, help="duration of the load in seconds")
+    parser.add_argument("--requests", type=int, default=None, help="total number of requests")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"weights of operations, default: {DEFAULT_MIX}")
+    parser.add_argument("--links", type=int, default=10, help="number of sc-links found and read by one request")
+    parser.add_argument("--elements", type=int, default=10, help="number of nodes generated by one request")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the operations order")
+    parser.add_argument("--json", action="store_true", help="print the report as json")
+    args = parser.parse_args(argv)
+    if (args.url is None) == (not args.emulator):
+        parser.error("either url or --emulator must be set")
+    if args.duration is None and args.requests is None:
+        args.duration = 10.0
+    try:
+        args.mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main(argv: List[str] = None) -> int:
+    args = _parse_args(argv)
+    emulator = ScServerEmulator(latency=args.latency).start() if args.emulator else None
+    url = emulator.url if emulator else args.url
+    try:
+        client.connect(url)
+        if not client.is_connected():
+            print(f"Cannot connect to {url}", file=sys.stderr)
+            return 1
+        workload = Workload(args.links, args.elements)
+        report = run_load(args.mix, args.threads, args.duration, args.requests, workload, args.seed)
+    finally:
+        client.disconnect()
+        if emulator:
+            emulator.stop()
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.format())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,464 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sc_client.constants import common
+from sc_client.constants.common import RequestType, ScEventType
+from sc_client.constants.sc_type import bitmasks
+from sc_client.models import ScLinkContentType
+from sc_client.testing._websocket import WebSocketConnection, WebSocketServer
+
+logger = logging.getLogger(__name__)
+
+_EMULATOR_WORKERS = 8
+_FIRST_ADDR = 1024
+_CONTENT_TYPES = {content_type.value: content_type.name.lower() for content_type in ScLinkContentType}
+
+
+class _EmulatorError(Exception):
+    pass
+
+
+class _InvalidParamError(_EmulatorError):
+    pass
+
+
+class ScMemory:
+    """In-memory sc-graph with the subset of sc-memory operations used by the sc-server protocol"""
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.types: Dict[int, int] = {}
+        self.connectors: Dict[int, Tuple[int, int]] = {}
+        self.outgoing: Dict[int, Dict[int, None]] = {}
+        self.incoming: Dict[int, Dict[int, None]] = {}
+        self.contents: Dict[int, Tuple[Any, str]] = {}
+        self.keynodes: Dict[str, int] = {}
+        self._addrs = itertools.count(_FIRST_ADDR)
+
+    def is_element(self, addr: int) -> bool:
+        return addr in self.types
+
+    def get_type(self, addr: int) -> int:
+        return self.types.get(addr, bitmasks.SC_TYPE_UNKNOWN)
+
+    def _new_addr(self, sc_type: int) -> int:
+        addr = next(self._addrs)
+        self.types[addr] = sc_type
+        self.outgoing[addr] = {}
+        self.incoming[addr] = {}
+        return addr
+
+    def generate_node(self, sc_type: int) -> int:
+        if not sc_type & bitmasks.SC_TYPE_NODE:
+            raise _EmulatorError(f"Type {sc_type} is not a node type")
+        return self._new_addr(sc_type)
+
+    def generate_link(self, sc_type: int, content: Any = None, content_type: str = "string") -> int:
+        addr = self.generate_node(sc_type | bitmasks.SC_TYPE_NODE_LINK)
+        if content is not None:
+            self.contents[addr] = (content, content_type)
+        return addr
+
+    def generate_connector(self, sc_type: int, source: int, target: int) -> int:
+        if not sc_type & bitmasks.SC_TYPE_CONNECTOR:
+            raise _EmulatorError(f"Type {sc_type} is not a connector type")
+        if not self.is_element(source) or not self.is_element(target):
+            raise _EmulatorError(f"Incident elements {source} and {target} must exist")
+        addr = self._new_addr(sc_type)
+        self.connectors[addr] = (source, target)
+        self.outgoing[source][addr] = None
+        self.incoming[target][addr] = None
+        return addr
+
+    def collect_erased(self, addr: int) -> List[int]:
+        """Collect the element with all connectors that will be erased together with it"""
+        erased = [addr]
+        visited = {addr}
+        for current in erased:
+            for connector in itertools.chain(self.outgoing[current], self.incoming[current]):
+                if connector not in visited:
+                    visited.add(connector)
+                    erased.append(connector)
+        return erased
+
+    def erase(self, addr: int) -> List[int]:
+        erased = self.collect_erased(addr)
+        for current in erased:
+            source_target = self.connectors.pop(current, None)
+            if source_target is not None:
+                source, target = source_target
+                self.outgoing.get(source, {}).pop(current, None)
+                self.incoming.get(target, {}).pop(current, None)
+        for current in erased:
+            del self.types[current]
+            del self.outgoing[current]
+            del self.incoming[current]
+            self.contents.pop(current, None)
+        return erased
+
+    def set_content(self, addr: int, content: Any, content_type: str) -> bool:
+        if (self.get_type(addr) & bitmasks.SC_TYPE_NODE_LINK) != bitmasks.SC_TYPE_NODE_LINK:
+            return False
+        self.contents[addr] = (content, content_type)
+        return True
+
+    def resolve_keynode(self, idtf: str, sc_type: int = None) -> int:
+        addr = self.keynodes.get(idtf, 0)
+        if not addr and sc_type:
+            addr = self.generate_node(sc_type)
+            self.keynodes[idtf] = addr
+        return addr
+
+
+class _Request:
+    __slots__ = ("connection", "events")
+
+    def __init__(self, connection: WebSocketConnection) -> None:
+        self.connection = connection
+        self.events: List[Tuple[WebSocketConnection, str]] = []
+
+
+class _TemplateItem:
+    __slots__ = ("addr", "sc_type", "name")
+
+    def __init__(self, addr: int = 0, sc_type: int = 0, name: str = None) -> None:
+        self.addr = addr
+        self.sc_type = sc_type
+        self.name = name
+
+
+def _is_type_matched(element_type: int, template_type: int) -> bool:
+    required = template_type & ~bitmasks.SC_TYPE_CONSTANCY_MASK
+    return element_type & required == required
+
+
+class ScServerEmulator:
+    """
+    Local stand-in for the sc-server speaking its JSON WebSocket protocol.
+    It keeps the sc-graph in memory and answers each request after `latency` seconds.
+    """
+
+    def __init__(self, latency: float = 0.0, host: str = "127.0.0.1", port: int = 0, workers: int = _EMULATOR_WORKERS):
+        self.latency = latency
+        self.memory = ScMemory()
+        self._server = WebSocketServer(self._on_message, self._on_close, host, port)
+        self._workers = workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._subscriptions: Dict[int, Tuple[str, int, WebSocketConnection]] = {}
+        self._subscription_ids = itertools.count(1)
+        self._handlers: Dict[str, Callable[[Any, _Request], Any]] = {
+            RequestType.GENERATE_ELEMENTS.value: self._generate_elements,
+            RequestType.GENERATE_ELEMENTS_BY_SCS.value: self._generate_elements_by_scs,
+            RequestType.GET_ELEMENTS_TYPES.value: self._get_elements_types,
+            RequestType.ERASE_ELEMENTS.value: self._erase_elements,
+            RequestType.HANDLE_CONTENT.value: self._handle_content,
+            RequestType.SEARCH_KEYNODES.value: self._search_keynodes,
+            RequestType.SEARCH_BY_TEMPLATE.value: self._search_by_template,
+            RequestType.GENERATE_BY_TEMPLATE.value: self._generate_by_template,
+            RequestType.HANDLE_EVENT_SUBSCRIPTIONS.value: self._handle_event_subscriptions,
+        }
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self._server.host}:{self._server.port}/ws_json"
+
+    def start(self) -> ScServerEmulator:
+        self._pool = ThreadPoolExecutor(self._workers, thread_name_prefix="sc-server-emulator-worker")
+        self._server.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.stop()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self) -> ScServerEmulator:
+        return self.start()
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+    def _on_message(self, connection: WebSocketConnection, message: str) -> None:
+        pool = self._pool
+        if pool is None:
+            return
+        try:
+            pool.submit(self._process, connection, message)
+        except RuntimeError:
+            logger.debug("Emulator is stopped, the message is dropped")
+
+    def _on_close(self, connection: WebSocketConnection) -> None:
+        with self.memory.lock:
+            for subscription_id, (_, _, subscriber) in list(self._subscriptions.items()):
+                if subscriber is connection:
+                    del self._subscriptions[subscription_id]
+
+    def _process(self, connection: WebSocketConnection, message: str) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        request = _Request(connection)
+        response = {common.ID: None, common.EVENT: False, common.STATUS: True, common.ERRORS: []}
+        try:
+            data = json.loads(message)
+            response[common.ID] = data.get(common.ID)
+            handler = self._handlers.get(data.get(common.TYPE))
+            if handler is None:
+                raise _EmulatorError(f"Unknown request type: {data.get(common.TYPE)}")
+            with self.memory.lock:
+                response[common.PAYLOAD] = handler(data.get(common.PAYLOAD), request)
+        except Exception as e:  # pylint: disable=broad-except
+            # the sc-server answers every request, so any failure is reported to the client
+            response[common.STATUS] = False
+            response[common.PAYLOAD] = []
+            response[common.ERRORS] = [{common.MESSAGE: f"{type(e).__name__}: {e}"}]
+        connection.send_text(json.dumps(response))
+        for subscriber, event_message in request.events:
+            subscriber.send_text(event_message)
+
+    def _emit(self, request: _Request, event_type: ScEventType, addr: int, connector: int, other: int) -> None:
+        for subscription_id, (subscribed_type, subscribed_addr, subscriber) in self._subscriptions.items():
+            if subscribed_addr == addr and subscribed_type == event_type.value:
+                message = {
+                    common.ID: subscription_id,
+                    common.EVENT: True,
+                    common.STATUS: True,
+                    common.PAYLOAD: [addr, connector, other],
+                    common.ERRORS: [],
+                }
+                request.events.append((subscriber, json.dumps(message)))
+
+    def _emit_generate_connector(self, request: _Request, connector: int) -> None:
+        if not self._subscriptions:
+            return
+        source, target = self.memory.connectors[connector]
+        sc_type = self.memory.get_type(connector)
+        if sc_type & bitmasks.SC_TYPE_ARC == bitmasks.SC_TYPE_ARC:
+            self._emit(request, ScEventType.AFTER_GENERATE_OUTGOING_ARC, source, connector, target)
+            self._emit(request, ScEventType.AFTER_GENERATE_INCOMING_ARC, target, connector, source)
+        else:
+            self._emit(request, ScEventType.AFTER_GENERATE_EDGE, source, connector, target)
+            self._emit(request, ScEventType.AFTER_GENERATE_EDGE, target, connector, source)
+        self._emit(request, ScEventType.AFTER_GENERATE_CONNECTOR, source, connector, target)
+        self._emit(request, ScEventType.AFTER_GENERATE_CONNECTOR, target, connector, source)
+
+    def _emit_erase(self, request: _Request, addr: int) -> None:
+        source_target = self.memory.connectors.get(addr)
+        if source_target is not None:
+            source, target = source_target
+            if self.memory.get_type(addr) & bitmasks.SC_TYPE_ARC == bitmasks.SC_TYPE_ARC:
+                self._emit(request, ScEventType.BEFORE_ERASE_OUTGOING_ARC, source, addr, target)
+                self._emit(request, ScEventType.BEFORE_ERASE_INCOMING_ARC, target, addr, source)
+            else:
+                self._emit(request, ScEventType.BEFORE_ERASE_EDGE, source, addr, target)
+                self._emit(request, ScEventType.BEFORE_ERASE_EDGE, target, addr, source)
+            self._emit(request, ScEventType.BEFORE_ERASE_CONNECTOR, source, addr, target)
+            self._emit(request, ScEventType.BEFORE_ERASE_CONNECTOR, target, addr, source)
+        self._emit(request, ScEventType.BEFORE_ERASE_ELEMENT, addr, 0, 0)
+
+    def _generate_elements(self, payload: List[dict], request: _Request) -> List[int]:
+        addrs = []
+        for item in payload:
+            element = item[common.ELEMENT]
+            if element == common.Elements.NODE:
+                addrs.append(self.memory.generate_node(item[common.TYPE]))
+            elif element == common.Elements.LINK:
+                content_type = _CONTENT_TYPES[item.get(common.CONTENT_TYPE, ScLinkContentType.STRING.value)]
+                addrs.append(self.memory.generate_link(item[common.TYPE], item.get(common.CONTENT), content_type))
+            else:
+                source, target = (
+                    addrs[adj[common.VALUE]] if adj[common.TYPE] == common.Types.REF else adj[common.VALUE]
+                    for adj in (item[common.SOURCE], item[common.TARGET])
+                )
+                connector = self.memory.generate_connector(item[common.TYPE], source, target)
+                addrs.append(connector)
+                self._emit_generate_connector(request, connector)
+        return addrs
+
+    @staticmethod
+    def _generate_elements_by_scs(payload: List[dict], _: _Request) -> List[bool]:
+        raise _EmulatorError(f"SCs texts are not supported by the emulator: {len(payload)} given")
+
+    def _get_elements_types(self, payload: List[int], _: _Request) -> List[int]:
+        return [self.memory.get_type(addr) for addr in payload]
+
+    def _erase_elements(self, payload: List[int], request: _Request) -> bool:
+        for addr in payload:
+            if self.memory.is_element(addr):
+                if self._subscriptions:
+                    for erased in reversed(self.memory.collect_erased(addr)):
+                        self._emit_erase(request, erased)
+                self.memory.erase(addr)
+        return True
+
+    def _handle_content(self, payload: List[dict], request: _Request) -> List[Any]:
+        result = []
+        for command in payload:
+            command_type = command[common.COMMAND]
+            if command_type == common.CommandTypes.SET:
+                addr = command[common.ADDR]
+                is_set = self.memory.set_content(addr, command[common.DATA], command[common.TYPE])
+                if is_set:
+                    self._emit(request, ScEventType.BEFORE_CHANGE_LINK_CONTENT, addr, 0, 0)
+                result.append(is_set)
+            elif command_type == common.CommandTypes.GET:
+                value, content_type = self.memory.contents.get(command[common.ADDR], ("", "string"))
+                result.append({common.VALUE: value, common.TYPE: content_type})
+            elif command_type == common.CommandTypes.SEARCH:
+                data = command[common.DATA]
+                result.append([addr for addr, (value, _) in self.memory.contents.items() if value == data])
+            elif command_type == common.CommandTypes.SEARCH_LINKS_BY_CONTENT_SUBSTRING:
+                data = str(command[common.DATA])
+                result.append([addr for addr, (value, _) in self.memory.contents.items() if data in str(value)])
+            elif command_type == common.CommandTypes.SEARCH_LINKS_CONTENTS_BY_CONTENT_SUBSTRING:
+                data = str(command[common.DATA])
+                result.append([value for value, _ in self.memory.contents.values() if data in str(value)])
+            else:
+                raise _EmulatorError(f"Unknown content command: {command_type}")
+        return result
+
+    def _search_keynodes(self, payload: List[dict], _: _Request) -> List[int]:
+        result = []
+        for command in payload:
+            if command[common.COMMAND] == common.CommandTypes.RESOLVE:
+                result.append(self.memory.resolve_keynode(command[common.IDTF], command[common.ELEMENT_TYPE]))
+            else:
+                result.append(self.memory.resolve_keynode(command[common.IDTF]))
+        return result
+
+    def _handle_event_subscriptions(self, payload: dict, request: _Request) -> Any:
+        if common.CommandTypes.GENERATE in payload:
+            ids = []
+            for params in payload[common.CommandTypes.GENERATE]:
+                subscription_id = next(self._subscription_ids)
+                self._subscriptions[subscription_id] = (params[common.TYPE], params[common.ADDR], request.connection)
+                ids.append(subscription_id)
+            return ids
+        for subscription_id in payload.get(common.CommandTypes.ERASE, []):
+            self._subscriptions.pop(subscription_id, None)
+        return []
+
+    def _parse_template(self, payload: dict) -> Tuple[List[List[_TemplateItem]], Dict[str, int]]:
+        template = payload[common.TEMPLATE]
+        if not isinstance(template, list):
+            raise _EmulatorError("Only templates passed as triples are supported by the emulator")
+        params = {}
+        for alias, value in (payload.get(common.PARAMS) or {}).items():
+            addr = value if isinstance(value, int) else self.memory.resolve_keynode(value)
+            if not self.memory.is_element(addr):
+                raise _InvalidParamError(f"Param `{alias}` is not a valid element: {value}")
+            params[alias] = addr
+
+        triples = []
+        for triple in template:
+            items = []
+            for item in triple:
+                item_type, value, alias = item[common.TYPE], item[common.VALUE], item.get(common.ALIAS)
+                if item_type == common.Types.ADDR:
+                    items.append(_TemplateItem(addr=value, name=alias))
+                elif item_type == common.Types.TYPE:
+                    items.append(_TemplateItem(sc_type=value, name=alias))
+                else:
+                    items.append(_TemplateItem(name=value))
+            for template_item in items:
+                if template_item.name in params:
+                    template_item.addr = params[template_item.name]
+            triples.append(items)
+
+        aliases = {}
+        for index, template_item in enumerate(itertools.chain.from_iterable(triples)):
+            if template_item.name is not None and template_item.name not in aliases:
+                aliases[template_item.name] = index
+        return triples, aliases
+
+    def _search_by_template(self, payload: dict, _: _Request) -> dict:
+        try:
+            triples, aliases = self._parse_template(payload)
+        except _InvalidParamError:
+            return {common.ALIASES: {}, common.ADDRS: []}
+        rows = {}
+        for bindings in self._match(triples, 0, {}):
+            row = tuple(bindings[(index, position)] for index in range(len(triples)) for position in range(3))
+            rows[row] = None
+        return {common.ALIASES: aliases, common.ADDRS: [list(row) for row in rows]}
+
+    def _match(self, triples: List[List[_TemplateItem]], index: int, bindings: dict) -> Iterator[dict]:
+        if index == len(triples):
+            yield bindings
+            return
+        source, connector, target = triples[index]
+        fixed = [self._bound(item, bindings) for item in (source, connector, target)]
+        if fixed[1]:
+            candidates = [fixed[1]] if fixed[1] in self.memory.connectors else []
+        elif fixed[0]:
+            candidates = list(self.memory.outgoing.get(fixed[0], ()))
+        elif fixed[2]:
+            candidates = list(self.memory.incoming.get(fixed[2], ()))
+        else:
+            candidates = list(self.memory.connectors)
+        for candidate in candidates:
+            candidate_source, candidate_target = self.memory.connectors[candidate]
+            new_bindings = self._bind_triple(
+                index, (source, connector, target), fixed, (candidate_source, candidate, candidate_target), bindings
+            )
+            if new_bindings is not None:
+                yield from self._match(triples, index + 1, new_bindings)
+
+    def _bind_triple(
+        self, index: int, items: Tuple[_TemplateItem, ...], fixed: List[int], elements: Tuple[int, ...], bindings: dict
+    ) -> Optional[dict]:
+        new_bindings = dict(bindings)
+        for position, (item, element) in enumerate(zip(items, elements)):
+            if fixed[position] and fixed[position] != element:
+                return None
+            if item.sc_type and not _is_type_matched(self.memory.get_type(element), item.sc_type):
+                return None
+            if item.name is not None:
+                if new_bindings.setdefault(item.name, element) != element:
+                    return None
+            new_bindings[(index, position)] = element
+        return new_bindings
+
+    @staticmethod
+    def _bound(item: _TemplateItem, bindings: dict) -> int:
+        if item.addr:
+            return item.addr
+        return bindings.get(item.name, 0) if item.name is not None else 0
+
+    def _generate_by_template(self, payload: dict, request: _Request) -> dict:
+        triples, aliases = self._parse_template(payload)
+        bindings = {}
+        addrs = []
+        for source, connector, target in triples:
+            source_addr = self._bound(source, bindings) or self._generate_item(source, bindings)
+            target_addr = self._bound(target, bindings) or self._generate_item(target, bindings)
+            connector_addr = self._bound(connector, bindings)
+            if not connector_addr:
+                connector_addr = self.memory.generate_connector(connector.sc_type, source_addr, target_addr)
+                self._emit_generate_connector(request, connector_addr)
+                if connector.name is not None:
+                    bindings[connector.name] = connector_addr
+            addrs.extend((source_addr, connector_addr, target_addr))
+        return {common.ALIASES: aliases, common.ADDRS: addrs}
+
+    def _generate_item(self, item: _TemplateItem, bindings: dict) -> int:
+        if not item.sc_type:
+            raise _EmulatorError(f"Alias `{item.name}` is not bound")
+        sc_type = item.sc_type & ~bitmasks.SC_TYPE_CONSTANCY_MASK | bitmasks.SC_TYPE_CONST
+        addr = self.memory.generate_node(sc_type)
+        if item.name is not None:
+            bindings[item.name] = addr
+        return addr
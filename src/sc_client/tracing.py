@@ -0,0 +1,202 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+from __future__ import annotations
+
+import contextvars
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional
+
+COMMAND_ATTRIBUTE = "sc_client.command"
+COMMAND_ID_ATTRIBUTE = "sc_client.command_id"
+PAYLOAD_SIZE_ATTRIBUTE = "sc_client.payload_size"
+EVENT_SUBSCRIPTION_ID_ATTRIBUTE = "sc_client.event_subscription_id"
+EVENT_TYPE_ATTRIBUTE = "sc_client.event_type"
+
+EXECUTE_SPAN_NAME = "sc_client.execute"
+EVENT_CALLBACK_SPAN_NAME = "sc_client.event_callback"
+
+_active_span: contextvars.ContextVar[Optional[Any]] = contextvars.ContextVar("sc_client_active_span", default=None)
+
+
+class StatusCode(Enum):
+    UNSET = 0
+    OK = 1
+    ERROR = 2
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    trace_id: int
+    span_id: int
+
+
+@dataclass
+class Span:
+    name: str
+    context: SpanContext
+    parent: Optional[SpanContext] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    status: StatusCode = StatusCode.UNSET
+    start_time: int = field(default_factory=time.time_ns)
+    end_time: Optional[int] = None
+    exporter: Optional[InMemorySpanExporter] = field(default=None, repr=False, compare=False)
+
+    def get_span_context(self) -> SpanContext:
+        return self.context
+
+    def is_recording(self) -> bool:
+        return self.end_time is None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        self.attributes.update(attributes)
+
+    def set_status(self, status: StatusCode, description: str = None) -> None:
+        self.status = status
+        if description:
+            self.attributes["status_description"] = description
+
+    def record_exception(self, exception: BaseException, attributes: Dict[str, Any] = None) -> None:
+        event = {"name": "exception", "type": type(exception).__name__, "message": str(exception)}
+        event.update(attributes or {})
+        self.events.append(event)
+
+    def end(self, end_time: int = None) -> None:
+        if self.end_time is not None:
+            return
+        self.end_time = end_time or time.time_ns()
+        if self.exporter is not None:
+            self.exporter.export([self])
+
+
+class NonRecordingSpan:
+    def get_span_context(self) -> None:
+        return None
+
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
+
+    def set_status(self, status: StatusCode, description: str = None) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException, attributes: Dict[str, Any] = None) -> None:
+        pass
+
+    def end(self, end_time: int = None) -> None:
+        pass
+
+
+INVALID_SPAN = NonRecordingSpan()
+
+
+class InMemorySpanExporter:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._finished_spans: List[Span] = []
+
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            self._finished_spans.extend(spans)
+
+    def get_finished_spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._finished_spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._finished_spans.clear()
+
+
+class NoOpTracer:
+    @contextmanager
+    def start_as_current_span(self, name: str, attributes: Dict[str, Any] = None, **_) -> Iterator[NonRecordingSpan]:
+        yield INVALID_SPAN
+
+
+class ScTracer:
+    """Minimal tracer with the `start_as_current_span` interface of an OpenTelemetry tracer"""
+
+    def __init__(self, exporter: InMemorySpanExporter = None) -> None:
+        self.exporter = exporter
+        self._current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+            "sc_client_tracer_current_span", default=None
+        )
+
+    def start_span(self, name: str, attributes: Dict[str, Any] = None, **_) -> Span:
+        parent_span = self._current_span.get()
+        if parent_span is None:
+            parent = None
+            trace_id = random.getrandbits(128)
+        else:
+            parent = parent_span.context
+            trace_id = parent.trace_id
+        return Span(
+            name=name,
+            context=SpanContext(trace_id, random.getrandbits(64)),
+            parent=parent,
+            attributes=dict(attributes or {}),
+            exporter=self.exporter,
+        )
+
+    @contextmanager
+    def start_as_current_span(self, name: str, attributes: Dict[str, Any] = None, **kwargs) -> Iterator[Span]:
+        span = self.start_span(name, attributes, **kwargs)
+        token = self._current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            span.set_status(StatusCode.ERROR, f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            self._current_span.reset(token)
+            span.end()
+
+
+class _ScTracingState:
+    tracer = NoOpTracer()
+
+
+def set_tracer(tracer) -> None:
+    _ScTracingState.tracer = tracer if tracer is not None else NoOpTracer()
+
+
+def is_enabled() -> bool:
+    return not isinstance(_ScTracingState.tracer, NoOpTracer)
+
+
+def get_tracer():
+    return _ScTracingState.tracer
+
+
+def get_current_span():
+    span = _active_span.get()
+    return INVALID_SPAN if span is None else span
+
+
+@contextmanager
+def start_span(name: str, attributes: Dict[str, Any] = None) -> Iterator[Any]:
+    with _ScTracingState.tracer.start_as_current_span(name, attributes=attributes) as span:
+        token = _active_span.set(span)
+        try:
+            yield span
+        finally:
+            _active_span.reset(token)
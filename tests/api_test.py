@@ -4,6 +4,8 @@ Distributed under the MIT License
 (See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
 """
 
+import json
+import threading
 import time
 import unittest
 from unittest.mock import Mock, patch
@@ -15,13 +17,15 @@ from sc_client.constants import common, sc_type, sc_types
 from sc_client.constants.exceptions import (
     CommonErrorMessages,
     InvalidTypeError,
+    InvalidValueError,
     LinkContentOversizeError,
     PayloadMaxSizeError,
     ServerError,
 )
-from sc_client.constants.numeric import LINK_CONTENT_MAX_SIZE, MAX_PAYLOAD_SIZE
+from sc_client.constants.numeric import INCREMENTAL_DECODING_MIN_SIZE, LINK_CONTENT_MAX_SIZE, MAX_PAYLOAD_SIZE
 from sc_client.models import (
     ScAddr,
+    ScAddrArray,
     ScConstruction,
     ScEventSubscription,
     ScEventCallbackFunc,
@@ -31,6 +35,7 @@ from sc_client.models import (
     ScLinkContentType,
     SCs,
     ScTemplate,
+    ScTemplateResultSet,
 )
 from sc_client.sc_keynodes import ScKeynodes
 
@@ -88,6 +93,15 @@ class TestClientGenerateElements(ScTest):
         addr = client.generate_elements(const)
         assert len(addr) == 1
 
+    def test_generate_elements_as_array(self):
+        self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": [59154, 59155]}')
+        const = ScConstruction()
+        const.generate_node(sc_type.CONST_NODE)
+        const.generate_node(sc_type.CONST_NODE)
+        addrs = client.generate_elements(const, as_array=True)
+        assert isinstance(addrs, ScAddrArray)
+        assert addrs == [ScAddr(59154), ScAddr(59155)]
+
     def test_generate_link(self):
         self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": [1182470]}')
         link_content = ScLinkContent("Hello!", ScLinkContentType.STRING)
@@ -114,6 +128,24 @@ class TestClientGenerateElements(ScTest):
         addr_list = client.generate_elements(const)
         assert len(addr_list) == 3
 
+    def test_generate_elements_by_chunks(self):
+        self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": [10, 11]}')
+        self.get_server_message('{"errors": [], "id": 2, "event": false, "status": true, "payload": [12, 13]}')
+        const = ScConstruction()
+        const.generate_node(sc_type.CONST_NODE, "source")
+        const.generate_node(sc_type.CONST_NODE, "target")
+        const.generate_connector(sc_type.CONST_PERM_POS_ARC, "source", "target", "arc")
+        const.generate_connector(sc_type.CONST_PERM_POS_ARC, ScAddr(7), "arc")
+        addrs = client.generate_elements(const, chunk_size=2)
+        assert addrs == [ScAddr(10), ScAddr(11), ScAddr(12), ScAddr(13)]
+        first_chunk, second_chunk = (json.loads(call[0][0]) for call in self.mock_ws_app.send.call_args_list)
+        assert len(first_chunk[common.PAYLOAD]) == 2
+        arc, arc_to_arc = second_chunk[common.PAYLOAD]
+        assert arc[common.SOURCE] == {common.TYPE: common.Types.ADDR, common.VALUE: 10}
+        assert arc[common.TARGET] == {common.TYPE: common.Types.ADDR, common.VALUE: 11}
+        assert arc_to_arc[common.SOURCE] == {common.TYPE: common.Types.ADDR, common.VALUE: 7}
+        assert arc_to_arc[common.TARGET] == {common.TYPE: common.Types.REF, common.VALUE: 0}
+
     @pytest.mark.filterwarnings("ignore::DeprecationWarning")
     def test_create_construction_with_connector(self):
         self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": [33, 34, 2224]}')
@@ -240,6 +272,12 @@ class TestClientEraseElements(ScTest):
         status = client.erase_elements(ScAddr(0), ScAddr(0), ScAddr(0))
         assert status
 
+    def test_erase_elements_array(self):
+        self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": true}')
+        status = client.erase_elements(ScAddrArray.from_values([1, 2, 3]))
+        assert status
+        assert json.loads(self.mock_ws_app.send.call_args[0][0])[common.PAYLOAD] == [1, 2, 3]
+
     @pytest.mark.filterwarnings("ignore::DeprecationWarning")
     def test_delete_elements_list(self):
         self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": true}')
@@ -281,6 +319,21 @@ class TestClientHandleLinkContents(ScTest):
         assert content.data
         assert content.addr is None
 
+    def test_get_binary_link_content(self):
+        payload = '[{"value": "AAH/", "type": "binary"}]'
+        msg = '{"errors": [], "id": 1, "event": false, "status": true, "payload": ' + payload + "}"
+        self.get_server_message(msg)
+        content = client.get_link_content(ScAddr(0))[0]
+        assert content.content_type is ScLinkContentType.BINARY
+        assert content.data == b"\x00\x01\xff"
+        assert content.encoded_data == "AAH/"
+
+    def test_set_binary_link_content(self):
+        self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": [true]}')
+        assert client.set_link_contents(ScLinkContent(bytearray(b"\x00\x01\xff"), ScLinkContentType.BINARY, ScAddr(5)))
+        (command,) = json.loads(self.mock_ws_app.send.call_args[0][0])[common.PAYLOAD]
+        assert command[common.TYPE] == "binary" and command[common.DATA] == "AAH/"
+
     def test_search_link_by_content_empty(self):
         self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": [[]]}')
         test_str = "that line nor in KB"
@@ -659,6 +712,86 @@ class TestClientHandleTemplates(ScTest):
             for element in item:
                 assert isinstance(element, ScAddr)
 
+    def test_search_by_template_prepared(self):
+        payload = '{"aliases": {"_link": 2}, "addrs": [[10, 11, 12]]}'
+        templ = ScTemplate()
+        templ.triple(ScAddr(10), sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE_LINK >> "_link")
+        self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": ' + payload + "}")
+        client.search_by_template(templ, {"_link": ScAddr(12)})
+        assert templ.prepare() is templ
+        self.get_server_message('{"errors": [], "id": 2, "event": false, "status": true, "payload": ' + payload + "}")
+        results = client.search_by_template(templ, {"_link": ScAddr(12)})
+        assert results[0].get("_link") == ScAddr(12)
+        first_request, prepared_request = (json.loads(call[0][0]) for call in self.mock_ws_app.send.call_args_list)
+        assert prepared_request[common.ID] == 2
+        assert prepared_request[common.PAYLOAD] == first_request[common.PAYLOAD]
+        assert prepared_request[common.PAYLOAD][common.PARAMS] == {"_link": 12}
+
+    def test_prepared_template_reset(self):
+        templ = ScTemplate()
+        templ.triple(ScAddr(10), sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE >> "_node")
+        templ.prepare()
+        templ.triple("_node", sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE)
+        assert templ.prepared_payload is None
+
+    def test_search_by_template_project(self):
+        payload = '{"aliases": {"_node": 0, "_link": 2}, "addrs": [[10, 11, 12], [10, 13, 14], [10, 15, 12]]}'
+        for command_id in range(1, 4):
+            self.get_server_message(
+                '{"errors": [], "id": %d, "event": false, "status": true, "payload": %s}' % (command_id, payload)
+            )
+        templ = ScTemplate()
+        templ.triple(sc_type.VAR_NODE >> "_node", sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE_LINK >> "_link")
+        results = client.search_by_template(templ, project=["_link", "_node"])
+        assert [list(result.addrs) for result in results] == [
+            [ScAddr(12), ScAddr(10)],
+            [ScAddr(14), ScAddr(10)],
+            [ScAddr(12), ScAddr(10)],
+        ]
+        assert results[1].get("_node") == ScAddr(10)
+        results = client.search_by_template(templ, project=["_link"], distinct=True)
+        assert [result.get("_link") for result in results] == [ScAddr(12), ScAddr(14)]
+        with pytest.raises(InvalidValueError):
+            client.search_by_template(templ, project=["_arc"])
+
+    def test_search_by_template_as_columns(self):
+        payload = '{"aliases": {"_link": 2}, "addrs": [[10, 11, 12], [10, 13, 14]]}'
+        self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": ' + payload + "}")
+        templ = ScTemplate()
+        templ.triple(ScAddr(10), sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE_LINK >> "_link")
+        results = client.search_by_template(templ, as_columns=True)
+        assert isinstance(results, ScTemplateResultSet)
+        assert results.column("_link") == [ScAddr(12), ScAddr(14)]
+        assert results[1].get("_link") == ScAddr(14)
+
+    def test_search_by_template_as_iterator(self):
+        payload = '{"aliases": {"_link": 2}, "addrs": [[10, 11, 12], [10, 13, 14]]}'
+        self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": ' + payload + "}")
+        templ = ScTemplate()
+        templ.triple(ScAddr(10), sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE_LINK >> "_link")
+        results = client.search_by_template(templ, as_iterator=True)
+        assert not isinstance(results, list)
+        assert [result.get("_link") for result in results] == [ScAddr(12), ScAddr(14)]
+
+    def test_search_by_template_large_response(self):
+        rows = [[10, 11 + i, 12 + i % 7] for i in range(100_000)]
+        payload = json.dumps({"aliases": {"_link": 2}, "addrs": rows}, indent=1)
+        assert len(payload) > INCREMENTAL_DECODING_MIN_SIZE
+        for command_id in range(1, 5):
+            self.get_server_message(
+                '{"errors": [], "id": %d, "event": false, "status": true, "payload": %s}' % (command_id, payload)
+            )
+        templ = ScTemplate()
+        templ.triple(ScAddr(10), sc_type.VAR_PERM_POS_ARC >> "_arc", sc_type.VAR_NODE_LINK >> "_link")
+        results = client.search_by_template(templ)
+        assert [result._values for result in results] == rows
+        results = client.search_by_template(templ, as_columns=True)
+        assert len(results) == len(rows) and list(results.columns[1]) == [row[1] for row in rows]
+        results = client.search_by_template(templ, as_iterator=True)
+        assert [result.get("_link").value for result in results] == [row[2] for row in rows]
+        results = client.search_by_template(templ, project=["_link"], distinct=True)
+        assert [result.get("_link") for result in results] == [ScAddr(12 + i) for i in range(7)]
+
     @pytest.mark.filterwarnings("ignore::DeprecationWarning")
     def test_template_search(self):
         payload = (
@@ -769,6 +902,74 @@ class TestClientHandleTemplates(ScTest):
         assert len(gen_result) == 9
 
 
+class TestMessagesDecoding(ScTest):
+    def test_large_message_is_decoded_by_pool(self):
+        is_decoding_allowed = threading.Event()
+        decode_incrementally = session.decode_incrementally
+
+        def wait_and_decode(message):
+            is_decoding_allowed.wait(1)
+            return decode_incrementally(message)
+
+        contents = [{"value": "0" * 1000, "type": "string"}] * (INCREMENTAL_DECODING_MIN_SIZE // 1000)
+        large_message = json.dumps({"id": 1, "event": False, "status": True, "payload": contents})
+        with patch("sc_client.session.decode_incrementally", wait_and_decode):
+            self.get_server_message(large_message)
+            self.get_server_message('{"errors": [], "id": 2, "event": false, "status": true, "payload": [59154]}')
+            assert session._ScClientSession.decoding_messages == 1
+            assert session.receive_message(2)[common.PAYLOAD] == [59154]
+            is_decoding_allowed.set()
+            session._ScClientSession.is_open = False
+            assert len(session.receive_message(1)[common.PAYLOAD]) == len(contents)
+        assert session._ScClientSession.decoding_messages == 0
+
+    def test_malformed_large_message(self):
+        message = json.dumps({"id": 1, "event": False, "status": True, "payload": list(range(200_000))}, indent=1)
+        with self.assertLogs(session.logger, "ERROR"):
+            self.get_server_message(message[:-10])
+            with pytest.raises(ConnectionAbortedError):
+                session.receive_message(1)
+        self.mock_ws_app.close.assert_called_once()
+        assert not session.is_connected()
+
+    def test_large_list_payload(self):
+        addrs = list(range(1, 200_000))
+        self.get_server_message(json.dumps({"id": 1, "event": False, "status": True, "payload": addrs}, indent=1))
+        assert session.receive_message(1)[common.PAYLOAD] == addrs
+
+
+class TestMessagesWriting(ScTest):
+    def post_messages_while_writing(self, count: int) -> None:
+        with session._ScClientSession.writer_lock:
+            threads = [
+                threading.Thread(target=session.post_message, args=(common.ClientCommand.GET_ELEMENTS_TYPES, [i]))
+                for i in range(count)
+            ]
+            for thread in threads:
+                thread.start()
+            while session._ScClientSession.queued_messages < count:
+                time.sleep(0.001)
+        for thread in threads:
+            thread.join()
+
+    def test_messages_are_sent_by_one_writer(self):
+        self.post_messages_while_writing(5)
+        sent = [json.loads(call.args[0]) for call in self.mock_ws_app.send.call_args_list]
+        assert sorted(message[common.ID] for message in sent) == [1, 2, 3, 4, 5]
+        assert not session._ScClientSession.outgoing_messages
+        assert session._ScClientSession.written_messages == 5
+
+    def test_messages_are_coalesced(self):
+        client.set_coalescing(True)
+        self.post_messages_while_writing(5)
+        self.mock_ws_app.send.assert_not_called()
+        (call,) = self.mock_ws_app.sock.send_frame.call_args_list
+        frames = call.args[0].frames
+        assert sorted(json.loads(frame.data)[common.ID] for frame in frames) == [1, 2, 3, 4, 5]
+        session.post_message(common.ClientCommand.GET_ELEMENTS_TYPES, [6])
+        assert json.loads(self.mock_ws_app.send.call_args.args[0])[common.ID] == 6
+
+
 client_test_cases = (
     TestClientGenerateElements,
     TestClientGetElementTypes,
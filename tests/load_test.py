@@ -0,0 +1,59 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+import contextlib
+import io
+import json
+import unittest
+
+import pytest
+
+from sc_client import client, session
+from sc_client.testing import ScServerEmulator
+from sc_client.testing.load import Workload, main, parse_mix, percentile, run_load
+
+# pylint: disable=W0212
+
+
+class TestLoadHelpers(unittest.TestCase):
+    def test_parse_mix(self):
+        assert parse_mix("search_by_template=5,get_link_content") == {"search_by_template": 5, "get_link_content": 1}
+        with pytest.raises(ValueError):
+            parse_mix("unknown_operation=1")
+        with pytest.raises(ValueError):
+            parse_mix("generate_elements=0")
+
+    def test_percentile(self):
+        values = [i / 100 for i in range(1, 101)]
+        assert percentile(values, 50) == 0.5
+        assert percentile(values, 99) == 0.99
+        assert percentile([], 99) == 0.0
+
+
+class TestLoadGenerator(unittest.TestCase):
+    def tearDown(self) -> None:
+        session._ScClientSession.clear()
+
+    def test_run_load(self):
+        with ScServerEmulator() as server:
+            client.connect(server.url)
+            mix = parse_mix("search_by_template=1,generate_elements=1,get_link_content=1")
+            report = run_load(mix, threads=3, requests=60, workload=Workload(links_count=3), seed=1)
+            client.disconnect()
+        total = report.to_dict()["total"]
+        assert total["requests"] == 60
+        assert total["errors"] == 0
+        assert total["throughput"] > 0
+        assert total["p50_ms"] <= total["p99_ms"] <= total["max_ms"]
+        assert set(report.operations) == {"search_by_template", "generate_elements", "get_link_content"}
+
+    def test_main_with_emulator(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            assert main(["--emulator", "--threads", "2", "--requests", "20", "--json"]) == 0
+        report = json.loads(output.getvalue())
+        assert report["threads"] == 2
+        assert report["total"]["requests"] == 20
@@ -1,11 +1,28 @@
+import copy
+import io
+import pickle
 import unittest
 
 import pytest
 
-from sc_client.constants import ScType
+from sc_client.constants import ScType, common
 from sc_client.constants import sc_type as t
-from sc_client.constants.exceptions import CommonErrorMessages, InvalidTypeError
-from sc_client.models import ScAddr
+from sc_client.constants.exceptions import CommonErrorMessages, InvalidTypeError, LinkContentOversizeError
+from sc_client.constants.numeric import LINK_CONTENT_MAX_SIZE
+from sc_client.constants.sc_type import sc_type as sc_type_module
+from sc_client.models import (
+    ScAddr,
+    ScAddrArray,
+    ScConstruction,
+    ScConstructionCommand,
+    ScLinkContent,
+    ScLinkContentType,
+    ScTemplateResult,
+    ScTemplateResultSet,
+)
+from sc_client.models.sc_addr import addrs_from_values
+
+# pylint: disable=W0212
 
 
 def init_logic(obj):
@@ -40,6 +57,196 @@ class TestScAddr(unittest.TestCase):
     def test_is_equal(self):
         is_equal_logic(ScAddr)
 
+    def test_slots(self):
+        addr = ScAddr(1)
+        assert not hasattr(addr, "__dict__")
+        with pytest.raises(AttributeError):
+            addr.alias = "addr"
+
+    def test_hash(self):
+        assert hash(ScAddr(1000)) == hash(ScAddr(1000)) != hash(1000)
+        assert len({ScAddr(1000), ScAddr(1000), ScAddr(2000)}) == 2
+
+    def test_containers_with_other_keys(self):
+        assert ScAddr(5) not in {5}
+        assert 5 not in {ScAddr(5)}
+        assert len({5: 1, ScAddr(5): 2}) == 2
+        assert len({t.CONST_NODE: 1, ScAddr(t.CONST_NODE.value): 2, t.CONST_NODE.value: 3}) == 3
+        assert hash(t.CONST_NODE) != hash(ScAddr(t.CONST_NODE.value))
+
+    def test_addrs_from_values(self):
+        addrs = addrs_from_values([0, 1000])
+        assert addrs == [ScAddr(0), ScAddr(1000)]
+        assert all(type(addr) is ScAddr for addr in addrs)
+
+
+class TestScAddrArray(unittest.TestCase):
+    def test_init(self):
+        addrs = ScAddrArray([ScAddr(1), ScAddr(2)])
+        assert addrs == ScAddrArray.from_values([1, 2])
+        assert addrs.values.itemsize == 8
+        with pytest.raises(InvalidTypeError):
+            ScAddrArray([1, 2])
+
+    def test_sequence(self):
+        addrs = ScAddrArray.from_values([1, 2, 3, 2])
+        assert len(addrs) == 4
+        assert addrs[0] == ScAddr(1) and addrs[-1] == ScAddr(2)
+        assert addrs[1:3] == ScAddrArray.from_values([2, 3])
+        assert list(addrs) == [ScAddr(1), ScAddr(2), ScAddr(3), ScAddr(2)]
+        assert ScAddr(3) in addrs and ScAddr(4) not in addrs
+        assert addrs.unique() == [ScAddr(1), ScAddr(2), ScAddr(3)]
+
+    def test_set_operations(self):
+        first = ScAddrArray.from_values([1, 2, 3])
+        second = ScAddrArray.from_values([3, 4, 2])
+        assert first & second == ScAddrArray.from_values([2, 3])
+        assert first | second == ScAddrArray.from_values([1, 2, 3, 4])
+        assert first - second == ScAddrArray.from_values([1])
+        assert first ^ second == ScAddrArray.from_values([1, 4])
+        assert first - [ScAddr(1)] == ScAddrArray.from_values([2, 3])
+
+    def test_numpy(self):
+        numpy = pytest.importorskip("numpy")
+        addrs = ScAddrArray.from_values(numpy.array([1, 2, 3]))
+        assert addrs == ScAddrArray.from_values([1, 2, 3])
+        assert numpy.asarray(addrs).tolist() == [1, 2, 3]
+        assert addrs.to_numpy().dtype == numpy.uint64
+
+
+class TestScTemplateResult(unittest.TestCase):
+    def test_lazy_result(self):
+        aliases = {"_node": 0, "_arc": 1, "_link": 2}
+        result = ScTemplateResult.from_values([1, 2, 3], aliases)
+        assert len(result) == 3
+        assert result.get("_arc") == ScAddr(2)
+        assert result[2] == ScAddr(3)
+        assert list(result) == [(ScAddr(1), ScAddr(2), ScAddr(3))]
+        assert result._addrs is None
+        assert result.addrs == [ScAddr(1), ScAddr(2), ScAddr(3)]
+        assert result.addrs is result.addrs
+        assert result.get(0) == ScAddr(1)
+
+
+class TestScTemplateResultSet(unittest.TestCase):
+    def test_columns(self):
+        results = ScTemplateResultSet.from_rows([[1, 2, 3], [1, 4, 5], [6, 7, 3]], {"_node": 0, "_link": 2})
+        assert len(results) == 3
+        assert results.column("_node") == ScAddrArray.from_values([1, 1, 6])
+        assert results.column(1) == ScAddrArray.from_values([2, 4, 7])
+        assert results.unique("_link") == ScAddrArray.from_values([3, 5])
+
+    def test_rows(self):
+        results = ScTemplateResultSet.from_rows([[1, 2, 3], [4, 5, 6]], {"_node": 0})
+        assert [result.get("_node") for result in results] == [ScAddr(1), ScAddr(4)]
+        assert results[-1].addrs == [ScAddr(4), ScAddr(5), ScAddr(6)]
+        assert results[1:].column(2) == ScAddrArray.from_values([6])
+        with pytest.raises(IndexError):
+            results[2]
+
+    def test_empty(self):
+        results = ScTemplateResultSet.from_rows([], {"_node": 0})
+        assert len(results) == 0 and not list(results)
+        assert results.column("_node") == ScAddrArray()
+
+    def test_numpy(self):
+        numpy = pytest.importorskip("numpy")
+        results = ScTemplateResultSet.from_rows([[1, 2, 3], [4, 5, 6]], {})
+        assert results.to_numpy().tolist() == [[1, 2, 3], [4, 5, 6]]
+        assert results.to_numpy().dtype == numpy.uint64
+
+
+class TestScConstruction(unittest.TestCase):
+    def test_columns(self):
+        const = ScConstruction()
+        const.generate_node(t.CONST_NODE, "node")
+        const.generate_link(t.CONST_NODE_LINK, ScLinkContent("content", ScLinkContentType.STRING), "link")
+        const.generate_connector(t.CONST_PERM_POS_ARC, "node", ScAddr(5))
+        assert len(const) == 3
+        assert const.elements == [common.Elements.NODE, common.Elements.LINK, common.Elements.CONNECTOR]
+        assert const.types == [t.CONST_NODE, t.CONST_NODE_LINK, t.CONST_PERM_POS_ARC]
+        assert const.sources == [None, None, "node"] and const.targets == [None, None, ScAddr(5)]
+        assert const.contents == [None, "content", None]
+        assert const.content_types == [None, ScLinkContentType.STRING.value, None]
+        assert const.get_index("link") == 1
+
+    def test_commands(self):
+        const = ScConstruction()
+        const.generate_node(t.CONST_NODE, "node")
+        const.generate_link(t.CONST_NODE_LINK, ScLinkContent(1, ScLinkContentType.INT))
+        const.generate_connector(t.CONST_PERM_POS_ARC, "node", ScAddr(5))
+        assert const.commands == [
+            ScConstructionCommand(t.CONST_NODE, None),
+            ScConstructionCommand(t.CONST_NODE_LINK, {common.CONTENT: 1, common.TYPE: ScLinkContentType.INT.value}),
+            ScConstructionCommand(t.CONST_PERM_POS_ARC, {common.SOURCE: "node", common.TARGET: ScAddr(5)}),
+        ]
+
+    def test_deduplicated(self):
+        const = ScConstruction()
+        const.generate_node(t.CONST_NODE, "node")
+        const.generate_link(t.CONST_NODE_LINK, ScLinkContent("content", ScLinkContentType.STRING), "link")
+        const.generate_link(t.CONST_NODE_LINK, ScLinkContent("content", ScLinkContentType.STRING), "same_link")
+        const.generate_connector(t.CONST_PERM_POS_ARC, "node", "link", "arc")
+        const.generate_connector(t.CONST_PERM_POS_ARC, "node", "link", "same_arc")
+        const.generate_connector(t.CONST_TEMP_POS_ARC, "node", "link")
+        const.generate_connector(t.CONST_PERM_POS_ARC, "node", "same_link")
+        const.generate_connector(t.CONST_PERM_POS_ARC, ScAddr(5), "same_arc")
+        const.generate_connector(t.CONST_PERM_POS_ARC, ScAddr(5), "arc")
+
+        unique, indices = const.deduplicated()
+        assert indices == [0, 1, 2, 3, 3, 4, 5, 6, 6]
+        assert unique.aliases == {"node": 0, "link": 1, "same_link": 2, "arc": 3, "same_arc": 3}
+        assert len(unique) == 7
+
+        unique, indices = const.deduplicated(links=True)
+        assert indices == [0, 1, 1, 2, 2, 3, 2, 4, 4]
+        assert unique.types == [t.CONST_NODE, t.CONST_NODE_LINK, t.CONST_PERM_POS_ARC, t.CONST_TEMP_POS_ARC] + [
+            t.CONST_PERM_POS_ARC
+        ]
+        assert unique.get_index("same_link") == 1
+
+
+class TestScLinkContent(unittest.TestCase):
+    def test_binary(self):
+        content = ScLinkContent(memoryview(b"binary content"), ScLinkContentType.BINARY)
+        assert content.encoded_data == "YmluYXJ5IGNvbnRlbnQ="
+        assert content.encoded_data is content.encoded_data
+        assert ScLinkContent("text", ScLinkContentType.STRING).encoded_data == "text"
+        with pytest.raises(InvalidTypeError):
+            ScLinkContent(b"binary content", ScLinkContentType.STRING)
+        with pytest.raises(InvalidTypeError):
+            ScLinkContent("text", ScLinkContentType.BINARY)
+
+    def test_size(self):
+        data = bytearray(LINK_CONTENT_MAX_SIZE)
+        assert ScLinkContent(memoryview(data), ScLinkContentType.BINARY)
+        with pytest.raises(LinkContentOversizeError):
+            ScLinkContent(data + b"0", ScLinkContentType.BINARY)
+        with pytest.raises(LinkContentOversizeError):
+            ScLinkContent("0" * (LINK_CONTENT_MAX_SIZE + 1), ScLinkContentType.STRING)
+
+    def test_from_stream(self):
+        content = ScLinkContent.from_stream(io.BytesIO(b"binary content"), addr=ScAddr(1))
+        assert content.data == b"binary content" and content.addr == ScAddr(1)
+        content = ScLinkContent.from_stream(iter(["text ", "content"]), ScLinkContentType.STRING)
+        assert content.data == "text content"
+        assert ScLinkContent.from_stream(iter([]), ScLinkContentType.STRING).data == ""
+        with pytest.raises(LinkContentOversizeError):
+            ScLinkContent.from_stream(io.BytesIO(bytes(LINK_CONTENT_MAX_SIZE + 1)))
+        with pytest.raises(LinkContentOversizeError):
+            ScLinkContent.from_stream(iter([bytes(LINK_CONTENT_MAX_SIZE), b"0", b"never read"]))
+        with pytest.raises(InvalidTypeError):
+            ScLinkContent.from_stream(iter(["ab", "cd"]))
+        with pytest.raises(InvalidTypeError):
+            ScLinkContent.from_stream(iter([b"ab"]), ScLinkContentType.STRING)
+
+    def test_iter_chunks(self):
+        content = ScLinkContent(b"binary content", ScLinkContentType.BINARY)
+        chunks = list(content.iter_chunks(6))
+        assert all(isinstance(chunk, memoryview) for chunk in chunks)
+        assert b"".join(chunks) == b"binary content" and len(chunks) == 3
+        assert list(ScLinkContent(12345, ScLinkContentType.INT).iter_chunks(2)) == ["12", "34", "5"]
+
 
 class TestScType(unittest.TestCase):
     @classmethod
@@ -163,6 +370,18 @@ class TestScType(unittest.TestCase):
     def test_init(self):
         init_logic(ScType)
 
+    def test_interned(self):
+        assert ScType(t.CONST_NODE.value) is t.CONST_NODE
+        assert ScType(t.CONST_NODE) is t.CONST_NODE
+        assert copy.copy(t.CONST_NODE) is t.CONST_NODE
+        assert copy.deepcopy(t.CONST_NODE) is t.CONST_NODE
+        assert pickle.loads(pickle.dumps(t.CONST_NODE)) is t.CONST_NODE
+
+    def test_immutable(self):
+        with pytest.raises(AttributeError):
+            t.CONST_NODE.value = t.VAR_NODE.value
+        assert not hasattr(t.CONST_NODE, "__dict__")
+
     def test_is_valid(self):
         is_valid_logic(ScType)
 
@@ -625,6 +844,11 @@ class TestScType(unittest.TestCase):
         with pytest.raises(InvalidTypeError, match=CommonErrorMessages.INVALID_TYPE.value):
             t.COMMON_ARC.merge(t.MEMBERSHIP_ARC)
 
+    def test_merge_is_cached(self):
+        hits = sc_type_module._merge.cache_info().hits
+        assert t.NODE.merge(t.CONST_NODE_CLASS) is t.NODE.merge(t.CONST_NODE_CLASS)
+        assert sc_type_module._merge.cache_info().hits == hits + 1
+
     def test_has_constancy(self):
         assert t.CONST_NODE.has_constancy()
         assert t.VAR_NODE.has_constancy()
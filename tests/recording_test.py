@@ -0,0 +1,84 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+import math
+import os
+import tempfile
+import unittest
+
+from sc_client import client, recording, session
+from sc_client.constants import common, sc_type
+from sc_client.models import ScAddr, ScConstruction, ScTemplate
+from sc_client.testing import ScServerEmulator
+
+# pylint: disable=W0212
+
+
+class RecordingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.directory.name, "traffic.jsonl")
+        self.server = ScServerEmulator().start()
+        client.connect(self.server.url)
+
+    def tearDown(self) -> None:
+        client.disconnect()
+        self.server.stop()
+        session._ScClientSession.clear()
+        self.directory.cleanup()
+
+    def record_traffic(self) -> list:
+        with recording.TrafficRecorder(self.path) as recorder:
+            client.set_recorder(recorder)
+            const = ScConstruction()
+            const.generate_node(sc_type.CONST_NODE)
+            (node,) = client.generate_elements(const)
+            templ = ScTemplate()
+            templ.triple(node, sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE)
+            client.search_by_template(templ)
+            client.get_elements_types(node)
+            client.set_recorder(None)
+        return list(recording.read_recording(self.path))
+
+
+class TestTrafficRecorder(RecordingTest):
+    def test_frames_are_recorded(self):
+        frames = self.record_traffic()
+        assert [frame.direction for frame in frames] == [recording.OUTGOING, recording.INCOMING] * 3
+        assert [frame.frame[common.TYPE] for frame in frames[::2]] == [
+            common.RequestType.GENERATE_ELEMENTS.value,
+            common.RequestType.SEARCH_BY_TEMPLATE.value,
+            common.RequestType.GET_ELEMENTS_TYPES.value,
+        ]
+        assert all(
+            sent.frame[common.ID] == received.frame[common.ID] for sent, received in zip(frames[::2], frames[1::2])
+        )
+        assert frames == sorted(frames, key=lambda frame: frame.timestamp)
+
+    def test_ring_buffer_drops_oldest_frames(self):
+        recorder = recording.TrafficRecorder(self.path, buffer_size=2, flush_interval=60)
+        for i in range(5):
+            recorder.record(recording.OUTGOING, f'{{"id": {i}}}')
+        recorder.close()
+        assert recorder.dropped == 3
+        assert [frame.frame[common.ID] for frame in recording.read_recording(self.path)] == [3, 4]
+
+    def test_not_recorded_without_recorder(self):
+        client.get_elements_types(ScAddr(1))
+        assert session._ScClientSession.recorder is None
+
+
+class TestTrafficReplayer(RecordingTest):
+    def test_replay(self):
+        self.record_traffic()
+        report = recording.TrafficReplayer.from_file(self.path).replay(self.server.url, speed=math.inf)
+        assert report.sent == report.received == 3
+        assert report.lost == 0
+        assert set(report.to_dict()["requests"]) == {
+            common.RequestType.GENERATE_ELEMENTS.value,
+            common.RequestType.SEARCH_BY_TEMPLATE.value,
+            common.RequestType.GET_ELEMENTS_TYPES.value,
+        }
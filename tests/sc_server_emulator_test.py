@@ -0,0 +1,262 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+import io
+import threading
+import unittest
+
+import pytest
+
+from sc_client import client, session
+from sc_client.constants import common, sc_type
+from sc_client.constants.exceptions import InvalidTypeError, ServerError
+from sc_client.models import (
+    ScAddr,
+    ScConstruction,
+    ScEventSubscriptionParams,
+    ScIdtfResolveParams,
+    ScLinkContent,
+    ScLinkContentType,
+    ScTemplate,
+)
+from sc_client.testing import ScServerEmulator
+
+# pylint: disable=W0212
+
+
+class EmulatorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ScServerEmulator().start()
+        client.connect(self.server.url)
+        assert client.is_connected()
+
+    def tearDown(self) -> None:
+        client.disconnect()
+        self.server.stop()
+        session._ScClientSession.clear()
+
+    @staticmethod
+    def generate_node_with_link(content: str) -> list:
+        const = ScConstruction()
+        const.generate_node(sc_type.CONST_NODE, "node")
+        const.generate_link(sc_type.CONST_NODE_LINK, ScLinkContent(content, ScLinkContentType.STRING), "link")
+        const.generate_connector(sc_type.CONST_PERM_POS_ARC, "node", "link")
+        return client.generate_elements(const)
+
+
+class TestEmulatorElements(EmulatorTest):
+    def test_generate_and_erase_elements(self):
+        node, link, arc = self.generate_node_with_link("content")
+        node_type, link_type, arc_type = client.get_elements_types(node, link, arc)
+        assert node_type == sc_type.CONST_NODE
+        assert link_type == sc_type.CONST_NODE_LINK
+        assert arc_type == sc_type.CONST_PERM_POS_ARC
+
+        assert client.erase_elements(node)
+        assert client.get_elements_types(node, link, arc) == [sc_type.UNKNOWN, sc_type.CONST_NODE_LINK, sc_type.UNKNOWN]
+
+    def test_generate_elements_by_chunks(self):
+        const = ScConstruction()
+        const.generate_node(sc_type.CONST_NODE, "root")
+        for i in range(20):
+            const.generate_node(sc_type.CONST_NODE, f"node_{i}")
+            const.generate_connector(sc_type.CONST_PERM_POS_ARC, "root", f"node_{i}")
+        for i in range(1, 20):
+            const.generate_connector(sc_type.CONST_COMMON_ARC, f"node_{i - 1}", f"node_{i}")
+        addrs = client.generate_elements(const, chunk_size=7, window=3)
+        assert len(addrs) == len(const)
+        assert len(set(addrs)) == len(addrs)
+        root = addrs[const.get_index("root")]
+        templ = ScTemplate()
+        templ.triple(root, sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE >> "_node")
+        nodes = {result.get("_node") for result in client.search_by_template(templ)}
+        assert nodes == {addrs[const.get_index(f"node_{i}")] for i in range(20)}
+        templ = ScTemplate()
+        templ.triple(addrs[const.get_index("node_7")], sc_type.VAR_COMMON_ARC, sc_type.VAR_NODE >> "_next")
+        assert client.search_by_template(templ)[0].get("_next") == addrs[const.get_index("node_8")]
+
+    def test_generate_elements_deduplicated(self):
+        const = ScConstruction()
+        const.generate_node(sc_type.CONST_NODE, "node")
+        const.generate_link(sc_type.CONST_NODE_LINK, ScLinkContent("content", ScLinkContentType.STRING), "link")
+        for _ in range(3):
+            const.generate_connector(sc_type.CONST_PERM_POS_ARC, "node", "link")
+        addrs = client.generate_elements(const, deduplicate=True)
+        assert len(addrs) == 5
+        assert addrs[2] == addrs[3] == addrs[4]
+        templ = ScTemplate()
+        templ.triple(addrs[0], sc_type.VAR_PERM_POS_ARC, addrs[1])
+        assert len(client.search_by_template(templ)) == 1
+        addrs = client.generate_elements(const, as_array=True, deduplicate=True)
+        assert len(addrs) == 5 and len(set(addrs.values[2:])) == 1
+
+    def test_generate_elements_deduplicated_links(self):
+        const = ScConstruction()
+        for _ in range(2):
+            const.generate_link(sc_type.CONST_NODE_LINK, ScLinkContent("content", ScLinkContentType.STRING))
+        first, second = client.generate_elements(const, deduplicate=True)
+        assert first != second
+        first, second = client.generate_elements(const, deduplicate_links=True)
+        assert first == second
+
+    def test_wrong_connector_is_server_error(self):
+        const = ScConstruction()
+        const.generate_connector(sc_type.CONST_PERM_POS_ARC, ScAddr(1), ScAddr(2))
+        with pytest.raises(ServerError):
+            client.generate_elements(const)
+
+    def test_link_contents(self):
+        _, link, _ = self.generate_node_with_link("first content")
+        assert client.get_link_content(link)[0].data == "first content"
+        assert client.set_link_contents(ScLinkContent("second content", ScLinkContentType.STRING, link))
+        assert client.get_link_content(link)[0].data == "second content"
+        assert client.search_links_by_contents("second content") == [[link]]
+        assert client.search_links_by_contents_substrings("second") == [[link]]
+        assert client.search_link_contents_by_content_substrings("second") == [["second content"]]
+
+    def test_binary_link_contents(self):
+        data = bytes(range(256))
+        const = ScConstruction()
+        const.generate_link(sc_type.CONST_NODE_LINK, ScLinkContent(data, ScLinkContentType.BINARY))
+        (link,) = client.generate_elements(const)
+        content = client.get_link_content(link)[0]
+        assert content.content_type is ScLinkContentType.BINARY and content.data == data
+        assert client.set_link_contents(ScLinkContent(memoryview(data)[:16], ScLinkContentType.BINARY, link))
+        assert client.get_link_content(link)[0].data == data[:16]
+        assert client.search_links_by_contents(data[:16]) == [[link]]
+
+    def test_resolve_keynodes(self):
+        resolved, found = client.resolve_keynodes(
+            ScIdtfResolveParams(idtf="new_keynode", type=sc_type.CONST_NODE),
+            ScIdtfResolveParams(idtf="unknown_keynode", type=None),
+        )
+        assert resolved.is_valid()
+        assert not found.is_valid()
+        assert client.resolve_keynodes(ScIdtfResolveParams(idtf="new_keynode", type=None)) == [resolved]
+
+
+class TestEmulatorTemplates(EmulatorTest):
+    def test_search_and_generate_by_template(self):
+        node, link, arc = self.generate_node_with_link("content")
+        templ = ScTemplate()
+        templ.triple(node, sc_type.VAR_PERM_POS_ARC >> "_arc", sc_type.VAR_NODE_LINK >> "_link")
+
+        results = client.search_by_template(templ)
+        assert len(results) == 1
+        assert results[0].get("_arc") == arc
+        assert results[0].get("_link") == link
+
+        generated = client.generate_by_template(templ)
+        assert len(generated) == 3
+        assert len(client.search_by_template(templ)) == 2
+
+    def test_search_by_template_with_params(self):
+        node, link, _ = self.generate_node_with_link("content")
+        templ = ScTemplate()
+        templ.triple(sc_type.VAR_NODE >> "_node", sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE_LINK >> "_link")
+        assert len(client.search_by_template(templ, {"_node": node})) == 1
+        assert len(client.search_by_template(templ, {"_node": link})) == 0
+        assert len(client.search_by_template(templ, {"_node": "unknown_keynode"})) == 0
+
+
+class TestEmulatorPipelining(EmulatorTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.nodes = []
+        self.links = []
+        for i in range(10):
+            node, link, _ = self.generate_node_with_link(f"content {i}")
+            self.nodes.append(node)
+            self.links.append(link)
+        self.templ = ScTemplate()
+        self.templ.triple(sc_type.VAR_NODE >> "_node", sc_type.VAR_PERM_POS_ARC, sc_type.VAR_NODE_LINK >> "_link")
+
+    def test_search_by_template_batch(self):
+        params_list = [{"_node": node} for node in self.nodes]
+        results = list(client.search_by_template_batch(self.templ, params_list, window=3))
+        assert [result[0].get("_link") for result in results] == self.links
+        assert self.templ.prepared_payload is None
+        assert not session._ScClientSession.responses_dict
+
+    def test_search_by_template_batch_as_completed(self):
+        params_list = [{"_node": node} for node in self.nodes]
+        results = dict(client.search_by_template_batch(self.templ, params_list, window=4, ordered=False))
+        assert [results[i][0].get("_link") for i in range(len(self.nodes))] == self.links
+
+    def test_search_by_template_batch_is_closed(self):
+        params_list = [{"_node": node} for node in self.nodes]
+        results = client.search_by_template_batch(self.templ, params_list, window=5)
+        assert next(results)[0].get("_link") == self.links[0]
+        results.close()
+        assert len(client.search_by_template(self.templ, {"_node": self.nodes[0]})) == 1
+        assert not session._ScClientSession.responses_dict
+
+    def test_link_contents_stream(self):
+        sources = (io.StringIO(f"new content {i}") for i in range(len(self.links)))
+        contents = (
+            ScLinkContent.from_stream(source, ScLinkContentType.STRING, link)
+            for source, link in zip(sources, self.links)
+        )
+        assert all(client.set_link_contents_stream(contents, window=3))
+        contents = client.get_link_contents_stream(iter(self.links), window=3)
+        assert [content.data for content in contents] == [f"new content {i}" for i in range(len(self.links))]
+        assert not session._ScClientSession.responses_dict
+
+    def test_generate_by_template_batch(self):
+        params_list = [{"_node": node} for node in self.nodes]
+        results = client.generate_by_template_batch(self.templ, params_list, window=4)
+        assert [result.get("_node") for result in results] == self.nodes
+        assert all(len(client.search_by_template(self.templ, params)) == 2 for params in params_list)
+
+    def test_generate_by_template_batch_errors(self):
+        params_list = [{"_node": self.nodes[0]}, {"_node": ScAddr(1_000_000)}, "wrong params", {"_node": self.nodes[1]}]
+        with pytest.raises(ServerError):
+            client.generate_by_template_batch(self.templ, params_list[:2], return_exceptions=False)
+        results = client.generate_by_template_batch(self.templ, params_list)
+        assert results[0].get("_node") == self.nodes[0]
+        assert isinstance(results[1], ServerError)
+        assert isinstance(results[2], InvalidTypeError)
+        assert results[3].get("_node") == self.nodes[1]
+
+    def test_coalesced_requests_from_threads(self):
+        client.set_coalescing(True)
+        errors = []
+
+        def search(node, link):
+            try:
+                for _ in range(20):
+                    assert client.search_by_template(self.templ, {"_node": node})[0].get("_link") == link
+            except AssertionError as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=search, args=pair) for pair in zip(self.nodes, self.links)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert session._ScClientSession.written_messages == session._ScClientSession.queued_messages
+
+
+class TestEmulatorEvents(EmulatorTest):
+    def test_event_on_generated_arc(self):
+        node, link, _ = self.generate_node_with_link("content")
+        emitted = []
+        is_emitted = threading.Event()
+
+        def callback(*addrs):
+            emitted.append(addrs)
+            is_emitted.set()
+
+        params = ScEventSubscriptionParams(node, common.ScEventType.AFTER_GENERATE_OUTGOING_ARC, callback)
+        subscription = client.create_elementary_event_subscriptions(params)[0]
+        const = ScConstruction()
+        const.generate_connector(sc_type.CONST_TEMP_POS_ARC, node, link)
+        (arc,) = client.generate_elements(const)
+
+        assert is_emitted.wait(1)
+        assert emitted == [(node, arc, link)]
+        assert client.destroy_elementary_event_subscriptions(subscription)
@@ -0,0 +1,55 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+import unittest
+from array import array
+
+import pytest
+
+from sc_client.constants import sc_type
+from sc_client.constants.exceptions import InvalidTypeError
+from sc_client.constants.sc_type import batch
+
+TYPES = [
+    sc_type.CONST_NODE,
+    sc_type.CONST_NODE_LINK,
+    sc_type.CONST_PERM_POS_ARC,
+    sc_type.VAR_NODE,
+    sc_type.CONST_COMMON_EDGE,
+    sc_type.UNKNOWN,
+]
+
+
+class TestScTypeBatch(unittest.TestCase):
+    def assert_classified(self, masks: dict) -> None:
+        for name, mask in masks.items():
+            expected = [getattr(t, f"is_{name}")() for t in TYPES]
+            assert list(mask) == expected, name
+
+    def test_classify(self):
+        masks = batch.classify(TYPES, use_numpy=False)
+        assert set(masks) == set(batch.DEFAULT_CLASSES)
+        self.assert_classified(masks)
+        self.assert_classified(batch.classify([t.value for t in TYPES], batch.SUBTYPES, use_numpy=False))
+
+    def test_partition(self):
+        indices = batch.partition(TYPES, ("node", "link", "membership_arc", "var"), use_numpy=False)
+        assert indices == {
+            "node": array("Q", [0, 1, 3]),
+            "link": array("Q", [1]),
+            "membership_arc": array("Q", [2]),
+            "var": array("Q", [3]),
+        }
+
+    def test_unknown_class(self):
+        with pytest.raises(InvalidTypeError):
+            batch.classify(TYPES, ("unknown",))
+
+    def test_numpy(self):
+        numpy = pytest.importorskip("numpy")
+        self.assert_classified(batch.classify(TYPES, batch.SUBTYPES, use_numpy=True))
+        values = numpy.array([t.value for t in TYPES])
+        assert batch.partition(values, ("node",))["node"].tolist() == [0, 1, 3]
@@ -0,0 +1,106 @@
+"""
+This source file is part of an OSTIS project. For the latest info, see https://github.com/ostis-ai
+Distributed under the MIT License
+(See an accompanying file LICENSE or a copy at http://opensource.org/licenses/MIT)
+"""
+
+import threading
+
+import pytest
+from api_test import ScTest
+
+from sc_client import client, tracing
+from sc_client.constants import common, sc_type
+from sc_client.constants.exceptions import ServerError
+from sc_client.models import ScAddr, ScConstruction, ScEventSubscriptionParams
+
+# pylint: disable=W0212
+
+
+class TracingTest(ScTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.exporter = tracing.InMemorySpanExporter()
+        client.set_tracer(tracing.ScTracer(self.exporter))
+
+    def tearDown(self) -> None:
+        client.set_tracer(None)
+        super().tearDown()
+
+
+class TestRequestSpans(TracingTest):
+    def test_span_per_request(self):
+        self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": [59154]}')
+        const = ScConstruction()
+        const.generate_node(sc_type.CONST_NODE)
+        client.generate_elements(const)
+
+        spans = self.exporter.get_finished_spans()
+        assert len(spans) == 1
+        span = spans[0]
+        assert span.name == tracing.EXECUTE_SPAN_NAME
+        assert span.parent is None
+        assert span.attributes[tracing.COMMAND_ATTRIBUTE] == common.ClientCommand.GENERATE_ELEMENTS.name
+        assert span.attributes[tracing.COMMAND_ID_ATTRIBUTE] == 1
+        assert span.attributes[tracing.PAYLOAD_SIZE_ATTRIBUTE] > 0
+        assert span.end_time >= span.start_time
+
+    def test_nested_requests_share_trace(self):
+        self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": [33]}')
+        self.get_server_message('{"errors": [], "id": 2, "event": false, "status": true, "payload": [33]}')
+        tracer = tracing.get_tracer()
+        with tracer.start_as_current_span("agent") as parent:
+            client.get_elements_types(ScAddr(1))
+            client.get_elements_types(ScAddr(2))
+
+        *children, root = self.exporter.get_finished_spans()
+        assert root is parent
+        for child in children:
+            assert child.parent == root.context
+            assert child.context.trace_id == root.context.trace_id
+
+    def test_server_error_recorded(self):
+        errors = '"errors": [{"message": "type must be X, but is Y", "ref": 0}]'
+        self.get_server_message('{"id": 1, "event": false, "status": 0, "payload": [0], ' + errors + "}")
+        with pytest.raises(ServerError):
+            client.generate_elements_by_scs(["asd ->"])
+
+        span = self.exporter.get_finished_spans()[0]
+        assert span.status is tracing.StatusCode.ERROR
+        assert span.events[0]["type"] == ServerError.__name__
+
+    def test_no_op_tracer(self):
+        client.set_tracer(None)
+        self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": [33]}')
+        client.get_elements_types(ScAddr(1))
+        assert not self.exporter.get_finished_spans()
+
+
+class TestEventCallbackSpans(TracingTest):
+    def test_callback_continues_subscription_trace(self):
+        called = threading.Event()
+        callback_spans = []
+
+        def callback(*_):
+            callback_spans.append(tracing.get_current_span())
+            called.set()
+
+        self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": [19]}')
+        params = ScEventSubscriptionParams(ScAddr(1183238), common.ScEventType.BEFORE_ERASE_ELEMENT, callback)
+        client.create_elementary_event_subscriptions(params)
+        subscription_span = self.exporter.get_finished_spans()[0]
+
+        self.get_server_message('{"errors": [], "id": 19, "event": true, "status": true, "payload": [1183238, 0, 0]}')
+        assert called.wait(1)
+        callback_span = callback_spans[0]
+        assert callback_span.name == tracing.EVENT_CALLBACK_SPAN_NAME
+        assert callback_span.parent == subscription_span.context
+        assert callback_span.attributes[tracing.EVENT_SUBSCRIPTION_ID_ATTRIBUTE] == 19
+        assert callback_span.attributes[tracing.EVENT_TYPE_ATTRIBUTE] == common.ScEventType.BEFORE_ERASE_ELEMENT.value
+
+    def test_context_not_captured_without_tracer(self):
+        client.set_tracer(None)
+        self.get_server_message('{"errors": [], "id": 1, "event": false, "status": true, "payload": [19]}')
+        params = ScEventSubscriptionParams(ScAddr(1183238), common.ScEventType.BEFORE_ERASE_ELEMENT, lambda *_: None)
+        (subscription,) = client.create_elementary_event_subscriptions(params)
+        assert subscription.context is None